@@ -0,0 +1,528 @@
+"""
+Statische Daten für das Admin-Dashboard
+Mock-Daten, Screen-Definitionen und JSON-Schemas für den Screen Navigator und JSON Viewer.
+
+Liegt bewusst in einem importierbaren Modul: Streamlit führt pages/admin.py bei
+jedem Rerun neu aus, dieses Modul wird dagegen nur einmal pro Prozess gebaut.
+Die JSON-Schemas und ihre Serialisierungen entstehen lazy beim ersten Zugriff
+(PEP 562 ``__getattr__``).
+"""
+
+import json
+import sys
+from types import MappingProxyType
+
+from config.json_utils import json_bytes, json_default, orjson
+
+
+# =============================================================================
+# READ-ONLY HELPERS
+# =============================================================================
+
+# Nur kurze Strings (Keys, CEFR-Labels, Timestamps) internieren, keine Transkripte
+_INTERN_MAX_LEN = 64
+
+
+def _intern(value):
+    """Kurze Strings per sys.intern deduplizieren, alles andere unverändert."""
+    if isinstance(value, str) and len(value) <= _INTERN_MAX_LEN:
+        return sys.intern(value)
+    return value
+
+
+def _freeze(obj):
+    """Rekursiv read-only machen: dict → MappingProxyType, list → tuple.
+
+    Kurze String-Keys und -Werte werden dabei gleich interniert.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({_intern(key): _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return _intern(obj)
+
+
+def thaw(obj):
+    """Gegenstück zu _freeze: liefert eine veränderbare Kopie aus dicts/lists."""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {key: thaw(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(value) for value in obj]
+    return obj
+
+
+def clone_mock_data(obj):
+    """Veränderbare tiefe Kopie der read-only Mock-Daten (orjson-Roundtrip, sonst thaw)."""
+    if orjson is not None:
+        return orjson.loads(json_bytes(obj))
+    return thaw(obj)
+
+
+# =============================================================================
+# SCREEN NAVIGATOR: Mock-Daten für realistische Tests
+# =============================================================================
+
+# Rekursiv read-only und nur einmal im Speicher (auch JSON_SCHEMAS referenziert Teile davon).
+# Werte, die in den Session State wandern, werden per clone_mock_data() aufgetaut/kopiert.
+MOCK_DATA = _freeze({
+    "transcript": """Guten Tag, mein Name ist Maria Schneider. Ich freue mich, heute die Möglichkeit zu haben, mich Ihnen vorzustellen.
+
+Ich habe meinen Master in Wirtschaftsinformatik an der TU München abgeschlossen und arbeite seit drei Jahren als Projektmanagerin bei einem mittelständischen IT-Unternehmen.
+
+In meiner aktuellen Position bin ich verantwortlich für die Koordination von agilen Entwicklungsteams und die Kommunikation mit unseren internationalen Kunden. Dabei habe ich besonders meine Fähigkeiten in der interkulturellen Zusammenarbeit und im Stakeholder-Management ausgebaut.
+
+Für diese Position bringe ich nicht nur meine technische Expertise mit, sondern auch meine Leidenschaft für innovative Lösungen und meine Erfahrung in der Führung von cross-funktionalen Teams.
+
+Ich freue mich auf Ihre Fragen.""",
+
+    "learner_goal": "Ich möchte meine Vorstellung klar strukturieren und professionell wirken.",
+    
+    "learner_context": "Ich habe nächste Woche ein echtes Bewerbungsgespräch bei einem großen Konzern.",
+    
+    "pretest_responses": {
+        "cefr_overall": {"value": "B2", "answered_at": "2026-01-23T14:30:00"},
+        "cefr_speaking": {"value": "B2", "answered_at": "2026-01-23T14:30:15"},
+        "has_official_cert": {"value": True, "answered_at": "2026-01-23T14:30:20"},
+        "official_cert_type": {"value": "Goethe B2 (bestanden)", "answered_at": "2026-01-23T14:30:25"},
+        "native_language": {"value": "Spanisch", "answered_at": "2026-01-23T14:29:00"},
+        "other_languages": {"value": "Englisch (C1), Französisch (A2)", "answered_at": "2026-01-23T14:29:10"},
+        "learning_duration_months": {"value": 36, "answered_at": "2026-01-23T14:29:30"},
+        "learning_context": {"value": ["university", "work", "living_dach"], "answered_at": "2026-01-23T14:29:45"},
+        "masq_scores": {
+            "factors": {
+                "PE": {"mean": 4.0, "sum": 8, "items": 2},
+                "PS": {"mean": 3.7, "sum": 11, "items": 3},
+                "PK": {"mean": 3.3, "sum": 10, "items": 3},
+                "DA": {"mean": 3.5, "sum": 7, "items": 2},
+                "MT": {"mean": 2.5, "sum": 5, "items": 2}
+            },
+            "total": 31,
+            "level": "medium",
+            "level_label": "Mittlere metakognitive Awareness"
+        }
+    },
+    
+    "kleiner_baer_result": {
+        "metrics_summary": {
+            "word_count": 142,
+            "sentence_count": 8,
+            "avg_sentence_length": 17.75,
+            "type_token_ratio": 0.72,
+            "lexical_density": 0.58,
+            "filler_count": 0,
+            "filler_ratio": 0.0,
+            "connector_count": 5,
+            "modal_verb_count": 2,
+            "subjunctive_count": 0,
+            "formal_markers": ["freue mich", "Möglichkeit", "verantwortlich", "Expertise"],
+            "informal_markers": []
+        },
+        "cefr": {
+            "label": "B2",
+            "score": 0.72,
+            "confidence": 0.81,
+            "indicators": {
+                "vocabulary": "B2",
+                "syntax": "B2",
+                "coherence": "B2"
+            }
+        },
+        "disce_metrics": {
+            "level_match": 0.85,
+            "prosody_intelligibility": 0.78,
+            "sentence_cohesion": 0.82,
+            "task_exam_fit": 0.90,
+            "goal_progress": 0.75
+        },
+        "hotspots": [
+            {
+                "type": "strength",
+                "text": "klare Struktur",
+                "severity": "positive",
+                "suggestion": "Gute chronologische Gliederung: Ausbildung → Erfahrung → Stärken"
+            },
+            {
+                "type": "register_match",
+                "text": "formell-professionell",
+                "severity": "positive",
+                "suggestion": "Angemessenes Register für Bewerbungsgespräch"
+            }
+        ],
+        "register_analysis": {
+            "target": "formell-professionell",
+            "detected": "formell-professionell",
+            "match_score": 0.90,
+            "formal_features": 4,
+            "informal_features": 0
+        }
+    },
+    
+    "feedback_text": """## 🎯 Aufgabenerfüllung
+
+Sie haben die Aufgabe gut erfüllt: Ihr Werdegang ist klar nachvollziehbar, und Sie haben einen Bogen zur angestrebten Position geschlagen. Besonders stark: Die Verbindung zwischen Ihrer Erfahrung und den Anforderungen der neuen Rolle.
+
+## 🧱 Struktur & roter Faden
+
+Ihre Präsentation folgt einer klaren Chronologie (Ausbildung → aktuelle Position → Stärken → Abschluss). Der rote Faden ist durchgehend erkennbar. 
+
+**Tipp:** Der Einstieg könnte noch prägnanter sein – statt der Floskel "Ich freue mich..." könnten Sie direkt mit Ihrem Kurzprofil starten.
+
+## 🎭 Ton & Wirkung
+
+Der Ton ist angemessen formell-professionell. Sie klingen kompetent und selbstsicher. Die Formulierung "Leidenschaft für innovative Lösungen" wirkt authentisch.
+
+## 💬 Sprache im Detail
+
+- **Zeitformen:** Korrekt eingesetzt (Perfekt für Vergangenes, Präsens für Aktuelles)
+- **Wortschatz:** Guter Einsatz von Fachbegriffen (Stakeholder-Management, cross-funktional)
+- **Satzbau:** Variiert und angemessen komplex
+
+## 📌 Fokus fürs nächste Mal
+
+**Einstieg schärfen:** Probieren Sie einen direkteren Einstieg wie: "Ich bin Projektmanagerin mit Schwerpunkt agile Methoden und bringe drei Jahre Erfahrung in der IT-Branche mit."
+"""
+})
+
+
+# Statische Teile des Mock-coach_input; Session-abhängige Felder setzt apply_screen_state()
+MOCK_COACH_INPUT_TEMPLATE = _freeze({
+    "pretest_self_assessment": {
+        "cefr_overall": "B2",
+        "cefr_speaking": "B2",
+    },
+    "task_metadata": {
+        "task_id": "cv_self_presentation",
+        "situation": "Sie sind in einem Bewerbungsgespräch.",
+        "task": "Stellen Sie sich und Ihren beruflichen Werdegang vor.",
+        "target_level": "B2-C1",
+        "target_register": "formell-professionell",
+        "time_limit_seconds": 90,
+    },
+    "session_metadata": {
+        "mode": "mock_speaking",
+        "duration_seconds": 85,
+    },
+    "learner_planning": {
+        "goal": MOCK_DATA["learner_goal"],
+        "context": MOCK_DATA["learner_context"],
+    },
+})
+
+
+# Screen-Definitionen mit allen nötigen States (read-only, s. apply_screen_state)
+SCREEN_DEFINITIONS = _freeze({
+    "login": {
+        "name": "🔐 Login",
+        "description": "Nutzercode-Eingabe in der Sidebar",
+        "category": "Auth",
+        "states": {
+            "user_code_confirmed": False,
+            "user_code": "",
+        }
+    },
+    "pretest_cefr": {
+        "name": "📋 Pretest: CEFR",
+        "description": "CEFR-Selbsteinschätzung (Modul 0)",
+        "category": "Pretest",
+        "states": {
+            "user_code_confirmed": True,
+            "user_code": "TEST_NAV",
+            "pretest_completed": False,
+            "pretest_current_module": 0,
+            "pretest_responses": {},
+        }
+    },
+    "pretest_masq": {
+        "name": "📋 Pretest: MASQ",
+        "description": "MASQ-Fragebogen (Modul 1)",
+        "category": "Pretest",
+        "states": {
+            "user_code_confirmed": True,
+            "user_code": "TEST_NAV",
+            "pretest_completed": False,
+            "pretest_current_module": 1,
+            "pretest_responses": {
+                "cefr_overall": {"value": "B2", "answered_at": "2026-01-23T14:30:00"},
+                "cefr_speaking": {"value": "B2", "answered_at": "2026-01-23T14:30:15"},
+                "has_official_cert": {"value": False, "answered_at": "2026-01-23T14:30:20"},
+                "learning_duration_months": {"value": 24, "answered_at": "2026-01-23T14:29:30"},
+                "learning_context": {"value": ["university", "self_study"], "answered_at": "2026-01-23T14:29:45"},
+                "native_language": {"value": "Englisch", "answered_at": "2026-01-23T14:29:00"},
+            },
+        }
+    },
+    "level_recheck": {
+        "name": "🔄 Level-Recheck",
+        "description": "Niveau-Nachfrage (alle 5 Sessions)",
+        "category": "Pretest",
+        "states": {
+            "user_code_confirmed": True,
+            "user_code": "TEST_NAV",
+            "pretest_completed": True,
+            "pretest_show_recheck": True,
+            "session_count": 5,
+            "phase": "select",
+        }
+    },
+    "phase_select": {
+        "name": "1️⃣ Task-Auswahl",
+        "description": "Aufgabe wählen + Lernziel setzen",
+        "category": "Coach-Loop",
+        "states": {
+            "user_code_confirmed": True,
+            "user_code": "TEST_NAV",
+            "pretest_completed": True,
+            "pretest_show_recheck": False,
+            "phase": "select",
+            "selected_task_id": None,
+        }
+    },
+    "phase_record": {
+        "name": "2️⃣ Aufnahme",
+        "description": "Mock-Texteingabe / Audio-Aufnahme",
+        "category": "Coach-Loop",
+        "states": {
+            "user_code_confirmed": True,
+            "user_code": "TEST_NAV",
+            "pretest_completed": True,
+            "phase": "record",
+            "selected_task_id": "cv_self_presentation",
+            "recording_start": None,  # Wird dynamisch gesetzt
+        }
+    },
+    "phase_feedback": {
+        "name": "3️⃣ Feedback",
+        "description": "Feedback-Anzeige mit allen Tabs",
+        "category": "Coach-Loop",
+        "requires_mock_data": True,
+        "states": {
+            "user_code_confirmed": True,
+            "user_code": "TEST_NAV",
+            "pretest_completed": True,
+            "phase": "feedback",
+            "selected_task_id": "cv_self_presentation",
+        }
+    },
+})
+
+
+def _group_screens_by_category() -> MappingProxyType:
+    """Screens einmal nach Kategorie gruppieren: {Kategorie: ((screen_id, screen), ...)}."""
+    categories = {}
+    for screen_id, screen in SCREEN_DEFINITIONS.items():
+        categories.setdefault(screen.get("category", "Sonstige"), []).append((screen_id, screen))
+    return MappingProxyType({cat: tuple(screens) for cat, screens in categories.items()})
+
+
+SCREENS_BY_CATEGORY = _group_screens_by_category()
+
+
+# =============================================================================
+# JSON VIEWER: Hinweise, wann Daten befüllt werden
+# =============================================================================
+
+DATA_HINTS = MappingProxyType({
+    "pretest_responses": "→ Wird befüllt, wenn der User den Pretest abschließt",
+    "masq_scores": "→ Wird im MASQ-Modul des Pretests berechnet",
+    "coach_input": "→ Wird erstellt, wenn eine Sprechübung abgeschlossen wird",
+    "current_task": "→ Wird gesetzt, wenn eine Aufgabe ausgewählt wird",
+    "session_metadata": "→ Enthält Daten der aktuellen Session",
+    "kleiner_baer_result": "→ Wird nach der Textanalyse befüllt (Phase 3)",
+    "cefr_estimation": "→ Teil der Kleiner-Bär-Analyse",
+    "disce_metrics": "→ Teil der Kleiner-Bär-Analyse",
+    "hotspots": "→ Erkannte Problemstellen aus der Analyse",
+    "payloads": "→ Wenn Daten an Airtable gesendet werden",
+    "llm_calls": "→ Wenn GPT-Feedback generiert wird",
+    "errors": "→ Bei Fehlern in der App",
+    "events": "→ Bei Login, Session-Start, etc.",
+})
+
+DEFAULT_DATA_HINT = "→ Nutze den Screen Navigator oder Mock-Generatoren"
+
+
+# =============================================================================
+# JSON SCHEMAS (Erwartete Strukturen mit Beispielwerten)
+# =============================================================================
+
+def _build_json_schemas() -> dict:
+    """Erwartete JSON-Strukturen mit Beispielwerten."""
+    return {
+        # =========================================================================
+        # CONFIG
+        # =========================================================================
+        "app_config": {
+            "mock_mode": True,
+            "debug_mode": False,
+            "skip_pretest": False,
+            "disable_airtable": False,
+            "log_payloads": True,
+            "log_llm_calls": True,
+            "show_metrics_tab": True,
+            "show_llm_input_tab": True,
+        },
+        
+        "pretest_config": {
+            "version": "1.0",
+            "modules": [
+                {
+                    "id": "cefr_self_assessment",
+                    "title": "CEFR-Selbsteinschätzung",
+                    "questions": ["..."]
+                },
+                {
+                    "id": "masq_short",
+                    "title": "MASQ – Metakognitive Awareness",
+                    "scoring": {
+                        "factors": ["PE", "PS", "PK", "DA", "MT"],
+                        "scale": "1-5"
+                    }
+                }
+            ],
+            "level_recheck_interval": 5
+        },
+        
+        # =========================================================================
+        # PRETEST
+        # =========================================================================
+        "pretest_responses": MOCK_DATA["pretest_responses"],
+        
+        "masq_scores": MOCK_DATA["pretest_responses"]["masq_scores"],
+        
+        # =========================================================================
+        # SESSION
+        # =========================================================================
+        "coach_input": {
+            "user": {
+                "code": "ABC123",
+                "is_anonymous": False
+            },
+            "pretest": {
+                "completed": True,
+                "cefr_self_speaking": "B2",
+                "masq_level": "medium",
+            },
+            "task_metadata": {
+                "task_id": "cv_self_presentation",
+                "situation": "Sie sind in einem Bewerbungsgespräch.",
+                "task": "Stellen Sie sich und Ihren beruflichen Werdegang vor.",
+                "target_level": "B2-C1",
+                "target_register": "formell-professionell",
+                "time_limit_seconds": 90
+            },
+            "session_metadata": {
+                "session_id": "550e8400-e29b-41d4-a716-446655440000",
+                "session_number": 3,
+                "mode": "speaking",
+                "duration_seconds": 85
+            },
+            "learner_planning": {
+                "goal": "Ich möchte meine Vorstellung klar strukturieren",
+                "context": "Bewerbungsgespräch nächste Woche"
+            },
+            "transcript": "[Transkript der Aufnahme]",
+            "analysis": {
+                "layer1_deterministic": {},
+                "cefr": {"label": "B2", "score": 0.72},
+                "home_kpis": {},
+                "hotspots": []
+            },
+            "reflection": {
+                "text": "",
+                "submitted_at": None
+            }
+        },
+        
+        "current_task": {
+            "id": "cv_self_presentation",
+            "title": "Lebenslauf vorstellen im Bewerbungsgespräch",
+            "situation": "Sie sind in einem Bewerbungsgespräch.",
+            "task": "Stellen Sie sich und Ihren beruflichen Werdegang vor.",
+            "time_seconds": 90,
+            "register": "formell-professionell",
+            "cefr_target": "B2-C1",
+        },
+        
+        "session_metadata": {
+            "session_id": "550e8400-e29b-41d4-a716-446655440000",
+            "user_code": "ABC123",
+            "session_count": 3,
+            "phase": "feedback",
+        },
+        
+        # =========================================================================
+        # ANALYSE (Kleiner Bär Output)
+        # =========================================================================
+        "kleiner_baer_result": MOCK_DATA["kleiner_baer_result"],
+        
+        "cefr_estimation": MOCK_DATA["kleiner_baer_result"]["cefr"],
+        
+        "disce_metrics": MOCK_DATA["kleiner_baer_result"]["disce_metrics"],
+        
+        "hotspots": MOCK_DATA["kleiner_baer_result"]["hotspots"],
+        
+        # =========================================================================
+        # LOGS
+        # =========================================================================
+        "payload_log_entry": {
+            "timestamp": "2026-01-23T15:03:00",
+            "endpoint": "make_webhook",
+            "payload": {"session_id": "...", "user_code": "ABC123"},
+            "response": {"status_code": 200}
+        },
+        
+        "llm_call_log_entry": {
+            "timestamp": "2026-01-23T15:02:00",
+            "prompt_type": "gpt_coach",
+            "model": "gpt-4o-mini",
+            "input": {"coach_input": "..."},
+            "output": "## Feedback...",
+            "tokens_used": {"total": 1170}
+        },
+        
+        "error_log_entry": {
+            "timestamp": "2026-01-23T15:02:15",
+            "error_type": "whisper",
+            "message": "Audio file too short"
+        },
+        
+        "event_log_entry": {
+            "timestamp": "2026-01-23T14:55:00",
+            "event_type": "auth",
+            "message": "User eingeloggt"
+        }
+    }
+
+
+def _build_schema_json_strings() -> dict:
+    """Schemas einmal serialisieren (für die st.code-Ansicht im JSON Viewer)."""
+    return {
+        key: json.dumps(schema, indent=2, ensure_ascii=False, default=json_default)
+        for key, schema in _lazy("JSON_SCHEMAS").items()
+    }
+
+
+def _build_schemas_export_body() -> bytes:
+    """Alle Schemas einmal als JSON-Wert (Bytes) – der Export setzt nur noch den Kopf davor."""
+    return json_bytes(_lazy("JSON_SCHEMAS"), indent=True)
+
+
+_LAZY_BUILDERS = {
+    "JSON_SCHEMAS": _build_json_schemas,
+    "SCHEMA_JSON_STRINGS": _build_schema_json_strings,
+    "SCHEMAS_EXPORT_BODY": _build_schemas_export_body,
+}
+
+
+def _lazy(name: str):
+    """Gibt eine lazy Konstante zurück und baut sie beim ersten Zugriff."""
+    module_globals = globals()
+    if name not in module_globals:
+        module_globals[name] = _LAZY_BUILDERS[name]()
+    return module_globals[name]
+
+
+def __getattr__(name: str):
+    """Modul-Zugriff auf JSON_SCHEMAS & Co. (PEP 562)."""
+    if name not in _LAZY_BUILDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _lazy(name)
@@ -4,7 +4,9 @@ Zentrale Verwaltung von Feature-Flags und Debug-Settings.
 """
 
 import streamlit as st
+from collections import deque
 from datetime import datetime
+from itertools import islice
 import json
 
 
@@ -28,24 +30,33 @@ DEFAULT_SETTINGS = {
     "show_llm_input_tab": True,     # LLM-Input Tab anzeigen
 }
 
+# Maximale Anzahl Einträge pro Log-Typ (deque(maxlen): ältere fallen automatisch heraus).
+# Fehler behalten mehr Verlauf; im Admin wird davon nur der Ausschnitt angezeigt.
+LOG_LIMITS = {
+    "payloads": 20,
+    "llm_calls": 10,
+    "errors": 500,
+    "events": 50,
+}
+
 
 # =============================================================================
 # STATE INITIALIZATION
 # =============================================================================
 
+def _new_log_store() -> dict:
+    """Leerer Log-Speicher: ein begrenzter deque pro Log-Typ."""
+    return {log_type: deque(maxlen=limit) for log_type, limit in LOG_LIMITS.items()}
+
+
 def init_app_config():
     """Initialisiert App-Config im Session State."""
     if "app_config" not in st.session_state:
         st.session_state.app_config = DEFAULT_SETTINGS.copy()
     
-    # Logging-Storage
+    # Logging-Storage: payloads, llm_calls, errors, events (s. LOG_LIMITS)
     if "debug_logs" not in st.session_state:
-        st.session_state.debug_logs = {
-            "payloads": [],         # Liste der gesendeten Payloads
-            "llm_calls": [],        # Liste der LLM-Aufrufe
-            "errors": [],           # Fehler-Log
-            "events": [],           # Allgemeine Events
-        }
+        st.session_state.debug_logs = _new_log_store()
 
 
 def get_config(key: str, default=None):
@@ -60,6 +71,16 @@ def set_config(key: str, value):
     st.session_state.app_config[key] = value
 
 
+def set_configs(values: dict) -> dict:
+    """Setzt mehrere Config-Werte auf einmal; schreibt nur geänderte Werte."""
+    init_app_config()
+    config = st.session_state.app_config
+    changed = {key: value for key, value in values.items() if config.get(key) != value}
+    if changed:
+        config.update(changed)
+    return changed
+
+
 def is_mock_mode() -> bool:
     """Shortcut: Ist Mock-Modus aktiv?"""
     return get_config("mock_mode", True)
@@ -96,10 +117,6 @@ def log_event(event_type: str, message: str, data: dict = None):
     }
     
     st.session_state.debug_logs["events"].append(log_entry)
-    
-    # Limit: Nur letzte 50 Events behalten
-    if len(st.session_state.debug_logs["events"]) > 50:
-        st.session_state.debug_logs["events"] = st.session_state.debug_logs["events"][-50:]
 
 
 def log_payload(endpoint: str, payload: dict, response: dict = None):
@@ -117,10 +134,6 @@ def log_payload(endpoint: str, payload: dict, response: dict = None):
     }
     
     st.session_state.debug_logs["payloads"].append(log_entry)
-    
-    # Limit
-    if len(st.session_state.debug_logs["payloads"]) > 20:
-        st.session_state.debug_logs["payloads"] = st.session_state.debug_logs["payloads"][-20:]
 
 
 def log_llm_call(prompt_type: str, input_data: dict, output: str = None):
@@ -138,10 +151,6 @@ def log_llm_call(prompt_type: str, input_data: dict, output: str = None):
     }
     
     st.session_state.debug_logs["llm_calls"].append(log_entry)
-    
-    # Limit
-    if len(st.session_state.debug_logs["llm_calls"]) > 10:
-        st.session_state.debug_logs["llm_calls"] = st.session_state.debug_logs["llm_calls"][-10:]
 
 
 def log_error(error_type: str, message: str, details: dict = None):
@@ -158,29 +167,39 @@ def log_error(error_type: str, message: str, details: dict = None):
     st.session_state.debug_logs["errors"].append(log_entry)
 
 
-def get_logs(log_type: str = None) -> list:
+def get_logs(log_type: str = None) -> deque | dict:
     """Holt Logs (alle oder nach Typ)."""
     init_app_config()
     
     if log_type:
-        return st.session_state.debug_logs.get(log_type, [])
+        return st.session_state.debug_logs.get(log_type, deque())
     
     return st.session_state.debug_logs
 
 
+def get_logs_tail(log_type: str, n: int = 20) -> list:
+    """Holt die letzten n Logs eines Typs, neueste zuerst."""
+    init_app_config()
+    logs = st.session_state.debug_logs.get(log_type, ())
+    return list(islice(reversed(logs), n))
+
+
+def get_logs_count(log_type: str) -> int:
+    """Anzahl der Logs eines Typs (ohne die Liste anzufassen)."""
+    init_app_config()
+    return len(st.session_state.debug_logs.get(log_type, ()))
+
+
 def clear_logs(log_type: str = None):
     """Löscht Logs."""
     init_app_config()
     
+    # In-place leeren, damit keine alten Referenzen (z.B. im Admin-Cache) weiterleben
     if log_type:
-        st.session_state.debug_logs[log_type] = []
+        st.session_state.debug_logs[log_type].clear()
     else:
-        st.session_state.debug_logs = {
-            "payloads": [],
-            "llm_calls": [],
-            "errors": [],
-            "events": [],
-        }
+        for logs in st.session_state.debug_logs.values():
+            logs.clear()
 
 
 # =============================================================================
@@ -196,7 +215,7 @@ def export_state_as_json() -> str:
         "session_count": st.session_state.get("session_count", 0),
         "pretest_completed": st.session_state.get("pretest_completed", False),
         "pretest_responses": st.session_state.get("pretest_responses", {}),
-        "debug_logs": st.session_state.get("debug_logs", {}),
+        "debug_logs": {k: list(v) for k, v in st.session_state.get("debug_logs", {}).items()},
     }
     
     return json.dumps(export_data, indent=2, ensure_ascii=False, default=str)
@@ -0,0 +1,43 @@
+"""
+JSON-Helper für App, Admin und openai_services
+Einheitliche Serialisierung nach UTF-8-Bytes: orjson wenn installiert, sonst stdlib.
+"""
+
+import json
+from collections import deque
+from types import MappingProxyType
+
+# Schnellere JSON-Serialisierung (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_default(obj):
+    """default-Hook für json/orjson: read-only Views wie dicts, Log-deques wie Listen serialisieren."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
+
+def json_bytes(obj, indent: bool = False) -> bytes:
+    """
+    UTF-8-JSON (orjson wenn installiert, sonst stdlib).
+
+    indent=False: kompakt (Webhook-Payloads, Digests), indent=True: 2 Leerzeichen
+    (Anzeige, Downloads, LLM-Input). Nicht-String-Keys und numpy-Werte werden
+    unterstützt, alles Unbekannte läuft über json_default.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_default, option=option)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=json_default)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=json_default)
+    return text.encode("utf-8")
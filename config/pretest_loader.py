@@ -15,6 +15,17 @@ import streamlit as st
 # CONFIG LOADER
 # =============================================================================
 
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _read_pretest_config(config_path: str, mtime: float) -> dict:
+    """Liest die JSON-Datei; einmal pro Prozess, mtime invalidiert bei Änderungen.
+
+    cache_resource statt cache_data: die Config wird nur gelesen, daher kein
+    Kopieren (Pickle-Roundtrip) bei jedem Rerun.
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_pretest_config(config_path: str = "config/pretest_config.json") -> dict:
     """Lädt die Pretest-Konfiguration aus der JSON-Datei."""
     path = Path(config_path)
@@ -22,8 +33,7 @@ def load_pretest_config(config_path: str = "config/pretest_config.json") -> dict
         st.error(f"❌ Pretest-Config nicht gefunden: {config_path}")
         return {"modules": []}
     
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_pretest_config(config_path, path.stat().st_mtime)
 
 
 def get_enabled_modules(config: dict) -> list:
@@ -2,9 +2,7 @@ from features_viewer import (
     tokenize_and_split,
     pos_tag_sentences,
     count_tokens,
-    sentence_lengths,
-    finite_verbs_per_sentence,
-    estimated_subclauses,
+    sentence_complexity,
     complex_nps_per_sentence,
     vorfeld_lengths,
     lexical_features,
@@ -340,9 +338,7 @@ def analyze_text_for_ui(text: str, use_grammar_check: bool = False) -> dict:
     errors_per_100_tokens = (num_issues / num_tokens * 100) if num_tokens > 0 else 0.0
 
     # 3) Komplexität
-    lengths = sentence_lengths(tagged_sentences)
-    finite_verbs = finite_verbs_per_sentence(tagged_sentences)
-    subclauses = estimated_subclauses(tagged_sentences)
+    lengths, finite_verbs, subclauses = sentence_complexity(tagged_sentences)
     complex_nps = complex_nps_per_sentence(tagged_sentences)
     vorfeld = vorfeld_lengths(tagged_sentences)
 
@@ -1,5 +1,7 @@
+import re
 import spacy
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import requests
@@ -32,14 +34,54 @@ def clamp01(x: float) -> float:
 # --- Tokenisierung & POS-Tagging -------------------------------------------
 
 
+_tokenizer = None
+_tagger = None
+
+
+def get_tokenizer():
+    """
+    Lazy-Loader für den SoMaJo-Tokenizer.
+    Wird nur einmal initialisiert und danach wiederverwendet.
+    """
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = SoMaJo(language="de_CMC", split_sentences=True)
+    return _tokenizer
+
+
+# Obergrenze für die Wort-Caches des Taggers (Lernertexte wiederholen viele Wörter)
+TAGGER_WORD_CACHE_SIZE = 20000
+
+
+def get_tagger():
+    """
+    Lazy-Loader für das HanTa-Modell (morphmodel_ger.pgz).
+    Das Laden dauert spürbar, daher nur einmal pro Prozess.
+
+    tag_sent ruft pro Token _tag_word (Tag-Wahrscheinlichkeiten) und
+    _analyze (Morphologie/Lemma) auf. Beide hängen nur vom Wort bzw.
+    (Wort, Tag) ab und werden deshalb pro Instanz memoisiert.
+    Geprüft gegen HanTa 1.2.1; fehlen die privaten Methoden in einer
+    anderen Version, bleibt der Tagger ungepatcht.
+    """
+    global _tagger
+    if _tagger is None:
+        tagger = ht.HanoverTagger("morphmodel_ger.pgz")
+        if hasattr(tagger, "_tag_word") and hasattr(tagger, "_analyze"):
+            tagger._tag_word = lru_cache(maxsize=TAGGER_WORD_CACHE_SIZE)(tagger._tag_word)
+            tagger._analyze = lru_cache(maxsize=TAGGER_WORD_CACHE_SIZE)(tagger._analyze)
+        _tagger = tagger
+    return _tagger
+
+
 def tokenize_and_split(text: str):
-    tokenizer = SoMaJo(language="de_CMC", split_sentences=True)
+    tokenizer = get_tokenizer()
     docs = [text]
     return list(tokenizer.tokenize_text(docs))
 
 
 def pos_tag_sentences(sentences):
-    tagger = ht.HanoverTagger("morphmodel_ger.pgz")
+    tagger = get_tagger()
     tagged_sentences = []
     for sent in sentences:
         words = [tok.text for tok in sent]
@@ -83,19 +125,37 @@ def sentence_lengths(tagged_sentences):
     return [len(sent) for sent in tagged_sentences]
 
 
-def finite_verbs_per_sentence(tagged_sentences):
-    """Zählt finite Verben pro Satz (VV(FIN), VA(FIN), VM(FIN))."""
-    counts = []
+# Finite Verben: VV(FIN), VA(FIN), VM(FIN)
+_FINITE_VERB_PREFIXES = ("VV", "VA", "VM")
+# Subordinierende Einleiter: KOUS, Relativpronomen, w-Wörter
+_SUBORDINATOR_TAGS = frozenset({"KOUS", "PRELS", "PWS"})
+
+
+def sentence_complexity(tagged_sentences):
+    """
+    Satzlänge, finite Verben und Nebensatz-Kandidaten in einem Durchlauf.
+    Gibt (lengths, finite_verbs, subclauses) zurück – je eine Liste pro Satz,
+    identisch zu sentence_lengths / finite_verbs_per_sentence / estimated_subclauses.
+    """
+    lengths, finite_verbs, subclauses = [], [], []
     for sent in tagged_sentences:
-        count = 0
+        subord_count = 0
+        finite_count = 0
         for token_tuple in sent:
             pos = token_tuple[-1]
-            if pos.endswith("(FIN)") and (
-                pos.startswith("VV") or pos.startswith("VA") or pos.startswith("VM")
-            ):
-                count += 1
-        counts.append(count)
-    return counts
+            if pos in _SUBORDINATOR_TAGS:
+                subord_count += 1
+            elif pos.endswith("(FIN)") and pos.startswith(_FINITE_VERB_PREFIXES):
+                finite_count += 1
+        lengths.append(len(sent))
+        finite_verbs.append(finite_count)
+        subclauses.append(min(subord_count, finite_count))
+    return lengths, finite_verbs, subclauses
+
+
+def finite_verbs_per_sentence(tagged_sentences):
+    """Zählt finite Verben pro Satz (VV(FIN), VA(FIN), VM(FIN))."""
+    return sentence_complexity(tagged_sentences)[1]
 
 
 def estimated_subclauses(tagged_sentences):
@@ -106,22 +166,19 @@ def estimated_subclauses(tagged_sentences):
     - PWS (w-Fragewörter in indirekten Fragen): was, wer, wo, ...
     + finites Verb im Satz -> 1 Nebensatz-Kandidat.
     """
-    counts = []
-    for sent in tagged_sentences:
-        subord_count = 0
-        finite_count = 0
-        for token_tuple in sent:
-            pos = token_tuple[-1]
-            # Subordinierende Einleiter: KOUS, Relativpronomen, w-Wörter
-            if pos in {"KOUS", "PRELS", "PWS"}:
-                subord_count += 1
-            # Finite Verben
-            if pos.endswith("(FIN)") and (
-                pos.startswith("VV") or pos.startswith("VA") or pos.startswith("VM")
-            ):
-                finite_count += 1
-        counts.append(min(subord_count, finite_count))
-    return counts
+    return sentence_complexity(tagged_sentences)[2]
+
+
+# Komplexe NP als Muster über einen Tag-Code pro Token: A = ADJ*, N = NN*, X = Rest
+_COMPLEX_NP_RE = re.compile(r"A+N")
+
+
+def _np_tag_code(pos: str) -> str:
+    if pos.startswith("ADJ"):
+        return "A"
+    if pos.startswith("NN"):
+        return "N"
+    return "X"
 
 
 def complex_nps_per_sentence(tagged_sentences):
@@ -131,24 +188,8 @@ def complex_nps_per_sentence(tagged_sentences):
     """
     counts = []
     for sent in tagged_sentences:
-        pos_list = [token_tuple[-1] for token_tuple in sent]
-        count = 0
-        i = 0
-        while i < len(pos_list) - 1:
-            if pos_list[i].startswith("ADJ"):
-                j = i
-                saw_adj = False
-                while j < len(pos_list) and pos_list[j].startswith("ADJ"):
-                    saw_adj = True
-                    j += 1
-                if j < len(pos_list) and pos_list[j].startswith("NN") and saw_adj:
-                    count += 1
-                    i = j + 1
-                else:
-                    i += 1
-            else:
-                i += 1
-        counts.append(count)
+        code = "".join(_np_tag_code(token_tuple[-1]) for token_tuple in sent)
+        counts.append(len(_COMPLEX_NP_RE.findall(code)))
     return counts
 
 
@@ -1641,9 +1682,7 @@ if __name__ == "__main__":
     )
 
     # 3) Komplexität
-    lengths = sentence_lengths(tagged_sentences)
-    finite_verbs = finite_verbs_per_sentence(tagged_sentences)
-    subclauses = estimated_subclauses(tagged_sentences)
+    lengths, finite_verbs, subclauses = sentence_complexity(tagged_sentences)
     complex_nps = complex_nps_per_sentence(tagged_sentences)
     vorfeld = vorfeld_lengths(tagged_sentences)
 
@@ -5,7 +5,7 @@ Orchestriert Audio → Analyse → Feedback Pipeline.
 """
 
 # Task-Verwaltung
-from .task_templates import get_task, get_all_tasks, get_task_choices
+from .task_templates import get_task, get_all_tasks, get_task_choices, get_task_choice_map
 
 # Prompts
 from .prompts import build_feedback_prompt, get_meta_prompt, SYSTEM_PROMPT_COACH
@@ -36,6 +36,7 @@ __all__ = [
     "get_task",
     "get_all_tasks", 
     "get_task_choices",
+    "get_task_choice_map",
     # Prompts
     "build_feedback_prompt",
     "get_meta_prompt",
@@ -145,6 +145,11 @@ def _mock_kleiner_baer_analysis(text: str) -> dict:
 # CLAUDE API INTEGRATION
 # =============================================================================
 
+# Interaktiver Pfad: lieber schnell scheitern (und auf Mock zurückfallen) als minutenlang warten
+CLAUDE_TIMEOUT_SECONDS = 30.0
+CLAUDE_MAX_RETRIES = 1
+
+
 def get_anthropic_client():
     """
     Erstellt Anthropic Client wenn API-Key vorhanden.
@@ -157,7 +162,11 @@ def get_anthropic_client():
     
     try:
         from anthropic import Anthropic
-        return Anthropic(api_key=api_key)
+        return Anthropic(
+            api_key=api_key,
+            timeout=CLAUDE_TIMEOUT_SECONDS,
+            max_retries=CLAUDE_MAX_RETRIES,
+        )
     except ImportError:
         raise ImportError(
             "anthropic nicht installiert. "
@@ -197,7 +206,10 @@ def generate_narrative_with_claude(
         model=model,
         max_tokens=max_tokens,
         temperature=temperature,
-        system=system_prompt,
+        # Statischer System-Prompt als Cache-Präfix (Prompt Caching) – nur das Transkript ist neu
+        system=[
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ],
         messages=[
             {"role": "user", "content": prompt}
         ]
@@ -281,6 +293,7 @@ class FeedbackGenerator:
         task: dict,
         prosody: ProsodyResult | dict | None = None,
         context: dict | None = None,
+        analysis: dict | None = None,
     ) -> FeedbackResult:
         """
         Generiert vollständiges Feedback für eine Speaking-Aufnahme.
@@ -290,14 +303,16 @@ class FeedbackGenerator:
             task: Task-Template aus task_templates.py
             prosody: Prosodie-Daten (optional)
             context: Zusätzlicher Kontext für Analyse
+            analysis: Bereits vorhandenes Kleiner-Bär-Ergebnis (spart die zweite Analyse)
             
         Returns:
             FeedbackResult mit Narrativ, Metriken, CEFR, Hotspots
         """
         start_time = datetime.now()
         
-        # 1. Kleiner Bär Analyse
-        analysis = analyze_with_kleiner_baer(transcript, context)
+        # 1. Kleiner Bär Analyse (nur wenn nicht schon übergeben)
+        if analysis is None:
+            analysis = analyze_with_kleiner_baer(transcript, context)
         
         # 2. Prosodie-Dict vorbereiten
         if isinstance(prosody, ProsodyResult):
@@ -379,6 +394,7 @@ def generate_feedback(
     task: dict,
     prosody: ProsodyResult | dict | None = None,
     use_mock: bool | None = None,
+    analysis: dict | None = None,
 ) -> FeedbackResult:
     """
     High-Level-Funktion für schnelle Feedback-Generierung.
@@ -388,6 +404,7 @@ def generate_feedback(
         task: Task-Template
         prosody: Prosodie-Daten (optional)
         use_mock: Mock-Modus erzwingen
+        analysis: Bereits vorhandenes Kleiner-Bär-Ergebnis (optional)
         
     Returns:
         FeedbackResult
@@ -406,7 +423,7 @@ def generate_feedback(
         print(result.narrative)
     """
     generator = FeedbackGenerator(use_mock=use_mock)
-    return generator.generate(transcript, task, prosody)
+    return generator.generate(transcript, task, prosody, analysis=analysis)
 
 
 def quick_analyze(text: str) -> dict:
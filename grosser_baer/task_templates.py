@@ -4,6 +4,9 @@ Berufliche Speaking-Szenarien für Großer Bär.
 Jedes Template definiert Kontext, Aufgabe, Zeitrahmen und Bewertungsfokus.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+
 TASK_TEMPLATES = {
     "cv_self_presentation": {
         "id": "cv_self_presentation",
@@ -104,3 +107,9 @@ def get_tasks_by_context(context: str) -> list[dict]:
 def get_task_choices() -> list[tuple[str, str]]:
     """Für Streamlit-Dropdown: Liste von (display_name, id)."""
     return [(f"{t['icon']} {t['title']}", t["id"]) for t in TASK_TEMPLATES.values()]
+
+
+@lru_cache(maxsize=1)
+def get_task_choice_map() -> MappingProxyType:
+    """Für Streamlit-Dropdown: {display_name: id}, einmal pro Prozess gebaut (read-only)."""
+    return MappingProxyType(dict(get_task_choices()))
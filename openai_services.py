@@ -5,36 +5,142 @@ OpenAI-Integration für Großer Bär
 - GPT-4o-mini: Coach-Feedback
 """
 
+from __future__ import annotations
+
+import hashlib
+import importlib.util
 import json
 import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import streamlit as st
-from openai import OpenAI
+
+# Das openai-Paket wird erst beim ersten echten API-Call importiert
+# (s. _openai_client_for_key) – der Mock-Modus braucht es nie.
+# Ob es installiert ist, zeigt OPENAI_AVAILABLE (ohne es zu laden).
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 # Zentraler System-Prompt aus prompts.py
 from grosser_baer.prompts import SYSTEM_PROMPT_COACH
 
+# Gemeinsamer JSON-Helper (orjson wenn installiert, sonst stdlib)
+from config.json_utils import json_bytes
+
+
+# Obergrenzen für die interaktiven Calls (SDK-Default: 10 Minuten Timeout)
+OPENAI_TIMEOUT_SECONDS = 60.0
+OPENAI_MAX_RETRIES = 1
+
+
+@st.cache_resource(show_spinner=False)
+def _openai_client_for_key(api_key: str) -> OpenAI:
+    # Ein Client pro Key und Prozess: Connection-Pool und Keep-Alive überleben Reruns
+    from openai import OpenAI
+    return OpenAI(
+        api_key=api_key,
+        timeout=OPENAI_TIMEOUT_SECONDS,
+        max_retries=OPENAI_MAX_RETRIES,
+    )
+
 
 def get_openai_client():
-    """Erstellt OpenAI Client mit API Key aus Secrets."""
+    """OpenAI Client mit API Key aus Secrets (wiederverwendet, solange der Key gleich bleibt)."""
     api_key = st.secrets.get("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY nicht in Streamlit Secrets gefunden!")
-    return OpenAI(api_key=api_key)
+    return _openai_client_for_key(api_key)
+
+
+# Hintergrund-Worker für Whisper (das Modul wird einmal pro Prozess geladen)
+_TRANSCRIBE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="whisper")
+
+# LRU-Cache der letzten Transkripte, Schlüssel: Digest der Audio-Bytes
+TRANSCRIPT_CACHE_SIZE = 32
+_transcript_cache: OrderedDict[str, str] = OrderedDict()
+_llm_cache_lock = threading.Lock()  # für _transcript_cache und _feedback_cache
+
+
+def audio_digest(audio_bytes: bytes) -> str:
+    """Kurzer Fingerprint der Audio-Bytes (erkennt eine neue Aufnahme)."""
+    return hashlib.blake2b(audio_bytes, digest_size=16).hexdigest()
+
+
+# Coach-Feedback: gleiches Transkript + gleicher Kontext → kein zweiter GPT-Call
+FEEDBACK_CACHE_SIZE = 32
+_feedback_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _lru_get(cache: OrderedDict, key: str) -> str | None:
+    with _llm_cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
 
 
-def transcribe_audio(audio_bytes: bytes) -> str:
+def _lru_put(cache: OrderedDict, key: str, value: str, max_size: int):
+    with _llm_cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _get_cached_transcript(key: str) -> str | None:
+    return _lru_get(_transcript_cache, key)
+
+
+def _store_transcript(key: str, text: str):
+    _lru_put(_transcript_cache, key, text, TRANSCRIPT_CACHE_SIZE)
+
+
+def feedback_cache_key(transcript_text: str, context: dict) -> str:
+    """
+    Fingerprint für das Coach-Feedback: Transkript + Kleiner-Bär-Kontext
+    (Task, Niveau, Register, Lernziel, MASQ, User-Code).
+    """
+    raw = json.dumps(
+        [transcript_text, context], sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_cached_feedback(key: str) -> str | None:
+    """Bereits generiertes Coach-Feedback zu diesem Schlüssel (oder None)."""
+    return _lru_get(_feedback_cache, key)
+
+
+def store_feedback(key: str, text: str):
+    """Merkt sich ein erfolgreich generiertes Coach-Feedback."""
+    _lru_put(_feedback_cache, key, text, FEEDBACK_CACHE_SIZE)
+
+
+def transcribe_audio(audio_bytes: bytes, client: OpenAI | None = None) -> str:
     """
     Transkribiert Audio mit Whisper.
     
+    Dieselbe Aufnahme wird nur einmal an die API geschickt (LRU-Cache).
+    
     Args:
         audio_bytes: Audio-Daten als Bytes (WAV format)
+        client: Bereits erzeugter OpenAI Client (optional)
     
     Returns:
         Transkribierter Text
     """
-    client = get_openai_client()
+    key = audio_digest(audio_bytes)
+    cached = _get_cached_transcript(key)
+    if cached is not None:
+        return cached
+
+    client = client or get_openai_client()
     
     # Audio temporär speichern (Whisper braucht eine Datei)
     with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
@@ -49,12 +155,47 @@ def transcribe_audio(audio_bytes: bytes) -> str:
                 language="de",
                 response_format="text",
             )
+        _store_transcript(key, response)
         return response
     finally:
         # Temp-Datei aufräumen
         temp_path.unlink(missing_ok=True)
 
 
+def start_transcription(audio_bytes: bytes) -> Future:
+    """
+    Startet die Whisper-Transkription im Hintergrund.
+    
+    Der Client wird im aufrufenden Streamlit-Thread erzeugt (liest st.secrets),
+    nur der API-Call läuft im Worker.
+    
+    Returns:
+        Future mit dem transkribierten Text
+    """
+    cached = _get_cached_transcript(audio_digest(audio_bytes))
+    if cached is not None:
+        future = Future()
+        future.set_result(cached)
+        return future
+
+    client = get_openai_client()
+    return _TRANSCRIBE_POOL.submit(transcribe_audio, audio_bytes, client)
+
+
+def _build_coach_messages(coach_input: dict) -> list[dict]:
+    """System- und User-Message für das Coach-Feedback (Session-Daten als JSON)."""
+    user_message = (
+        "Hier sind alle Daten zu einer Speaking-Session im JSON-Format.\n"
+        "Nutze diese Informationen, um Feedback gemäß deinen Anweisungen zu geben.\n"
+        "Prüfe ZUERST, ob das Thema der Aufgabe getroffen wurde!\n\n"
+        + json_bytes(coach_input, indent=True).decode("utf-8")
+    )
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT_COACH},
+        {"role": "user", "content": user_message},
+    ]
+
+
 def generate_coach_feedback(coach_input: dict) -> str:
     """
     Generiert Coaching-Feedback mit GPT-4o-mini.
@@ -69,21 +210,10 @@ def generate_coach_feedback(coach_input: dict) -> str:
         Formatiertes Feedback-String
     """
     client = get_openai_client()
-    
-    # User-Prompt: Session-Daten als JSON
-    user_message = (
-        "Hier sind alle Daten zu einer Speaking-Session im JSON-Format.\n"
-        "Nutze diese Informationen, um Feedback gemäß deinen Anweisungen zu geben.\n"
-        "Prüfe ZUERST, ob das Thema der Aufgabe getroffen wurde!\n\n"
-        + json.dumps(coach_input, indent=2, ensure_ascii=False)
-    )
 
     response = client.chat.completions.create(
         model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT_COACH},
-            {"role": "user", "content": user_message},
-        ],
+        messages=_build_coach_messages(coach_input),
         temperature=0.7,
         max_tokens=1200,
     )
@@ -91,6 +221,30 @@ def generate_coach_feedback(coach_input: dict) -> str:
     return response.choices[0].message.content.strip()
 
 
+def stream_coach_feedback(coach_input: dict):
+    """
+    Wie generate_coach_feedback, liefert den Text aber stückweise (Streaming).
+    
+    Für st.write_stream: das Feedback erscheint, sobald die ersten Tokens da sind.
+    
+    Yields:
+        Text-Deltas der Antwort
+    """
+    client = get_openai_client()
+
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=_build_coach_messages(coach_input),
+        temperature=0.7,
+        max_tokens=1200,
+        stream=True,
+    )
+    
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
 def check_api_connection() -> tuple[bool, str]:
     """
     Testet die OpenAI API-Verbindung.
@@ -4,26 +4,30 @@ Großer Bär – Speaking Coach UI
 Streamlit-Seite für Audio-Aufnahme und Feedback.
 """
 
+import hashlib
+import random
+import re
+import string
+import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-import json
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Großer Bär Imports
 from grosser_baer import (
     get_task,
-    get_task_choices,
+    get_task_choice_map,
     process_speaking_task,
     generate_feedback,
     format_feedback_markdown,
     SessionLogger,
 )
 
-# Kleiner Bär – deterministische Textanalyse
-from disce_core import analyze_text_for_llm
-
 # Pretest-Loader
 from config.pretest_loader import (
     load_pretest_config,
@@ -51,13 +55,32 @@ from config.app_config import (
     log_event,
 )
 
+# Gemeinsamer JSON-Helper (orjson wenn installiert, sonst stdlib)
+from config.json_utils import json_bytes
+
 # OpenAI Services (Whisper + GPT)
 try:
-    from openai_services import transcribe_audio, generate_coach_feedback, check_api_connection
-    OPENAI_AVAILABLE = True
+    from openai_services import (
+        audio_digest,
+        transcribe_audio,
+        start_transcription,
+        stream_coach_feedback,
+        feedback_cache_key,
+        get_cached_feedback,
+        store_feedback,
+        check_api_connection,
+        OPENAI_AVAILABLE,
+    )
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Audio-Aufnahme im Browser (nur im echten Modus nötig)
+try:
+    from audio_recorder_streamlit import audio_recorder
+    AUDIO_RECORDER_AVAILABLE = True
+except ImportError:
+    AUDIO_RECORDER_AVAILABLE = False
+
 
 # =============================================================================
 # KONFIGURATION
@@ -192,62 +215,51 @@ init_app_config()
 # SESSION STATE INITIALISIERUNG
 # =============================================================================
 
-if "phase" not in st.session_state:
-    st.session_state.phase = "select"  # select → record → feedback
-
-if "selected_task_id" not in st.session_state:
-    st.session_state.selected_task_id = None
-
-if "audio_bytes" not in st.session_state:
-    st.session_state.audio_bytes = None
-
-if "transcript" not in st.session_state:
-    st.session_state.transcript = None
-
-if "feedback_result" not in st.session_state:
-    st.session_state.feedback_result = None
-
-if "recording_start" not in st.session_state:
-    st.session_state.recording_start = None
-
-if "kleiner_baer_result" not in st.session_state:
-    st.session_state.kleiner_baer_result = None
-
-if "coach_input" not in st.session_state:
-    st.session_state.coach_input = None
+# Defaults für alle Session-Keys (session_id wird pro Session frisch erzeugt)
+SESSION_DEFAULTS = {
+    "phase": "select",              # select → record → feedback
+    "selected_task_id": None,
+    "audio_bytes": None,
+    "transcription_future": None,   # Whisper läuft ab Aufnahme im Hintergrund
+    "transcription_key": None,      # Digest der Audio-Bytes zur Future
+    "transcript": None,
+    "feedback_result": None,
+    "feedback_markdown": None,      # (feedback, markdown) – einmal formatiert
+    "recording_start": None,
+    "recording_start_mono": None,   # time.monotonic() beim Start (für die Dauer)
+    "recording_duration": None,     # einmal beim Eintritt in Phase 3 gemessen
+    "kleiner_baer_result": None,
+    "coach_input": None,
+    "coach_input_json": None,       # (coach_input, JSON-Text) für den LLM-Input-Tab
+    # Planungsfeld (Phase 1)
+    "learner_goal": "",
+    "learner_context": "",
+    # Reflexionsfeld (Phase 3)
+    "reflection_text": "",
+    "reflection_saved": False,
+    # Nutzercode (Mini-Login)
+    "user_code": "",
+    "user_code_confirmed": False,
+    # Session-Speicherung
+    "session_saved": False,
+    "airtable_save": None,          # (payload, Future) während der Webhook-Call läuft
+    "airtable_saved_digest": None,  # Fingerprint des zuletzt erfolgreich gesendeten Payloads
+    # Session-Zähler (für Level-Recheck)
+    "session_count": 0,
+}
+
+# Bleiben bei "Neue Session" erhalten (Pretest-Keys stehen nicht in den Defaults)
+KEYS_KEPT_ON_RESET = ("user_code", "user_code_confirmed", "session_count")
+SESSION_RESET_STATE = {
+    key: value for key, value in SESSION_DEFAULTS.items() if key not in KEYS_KEPT_ON_RESET
+}
+
+for key, default in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, default)
 
 if "session_id" not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4())
 
-# Planungsfeld (Phase 1)
-if "learner_goal" not in st.session_state:
-    st.session_state.learner_goal = ""
-
-if "learner_context" not in st.session_state:
-    st.session_state.learner_context = ""
-
-# Reflexionsfeld (Phase 3)
-if "reflection_text" not in st.session_state:
-    st.session_state.reflection_text = ""
-
-if "reflection_saved" not in st.session_state:
-    st.session_state.reflection_saved = False
-
-# Nutzercode (Mini-Login)
-if "user_code" not in st.session_state:
-    st.session_state.user_code = ""
-
-if "user_code_confirmed" not in st.session_state:
-    st.session_state.user_code_confirmed = False
-
-# Session-Speicherung
-if "session_saved" not in st.session_state:
-    st.session_state.session_saved = False
-
-# Session-Zähler (für Level-Recheck)
-if "session_count" not in st.session_state:
-    st.session_state.session_count = 0
-
 # =============================================================================
 # PRETEST INITIALISIERUNG
 # =============================================================================
@@ -262,43 +274,223 @@ PRETEST_CONFIG = load_pretest_config(PRETEST_CONFIG_PATH)
 
 def generate_user_code() -> str:
     """Generiert einen zufälligen 6-stelligen Nutzercode."""
-    import random
-    import string
     # Format: 3 Buchstaben + 3 Zahlen (z.B. ABC123)
-    letters = ''.join(random.choices(string.ascii_uppercase, k=3))
-    numbers = ''.join(random.choices(string.digits, k=3))
-    return f"{letters}{numbers}"
+    return "".join(
+        random.choices(string.ascii_uppercase, k=3) + random.choices(string.digits, k=3)
+    )
+
+
+# Gültiger Nutzercode: 4–20 Zeichen aus Buchstaben, Zahlen, - und _ (Umlaute erlaubt),
+# mindestens ein Buchstabe oder eine Zahl
+USER_CODE_RE = re.compile(r"(?=.*[^\W_])[\w-]{4,20}")
 
 
 def validate_user_code(code: str) -> tuple[bool, str]:
     """Validiert den Nutzercode. Gibt (is_valid, message) zurück."""
     if not code:
         return False, "Bitte gib einen Code ein."
+    if USER_CODE_RE.fullmatch(code):
+        return True, "OK"
+    # Ungültig → passende Meldung bestimmen
     if len(code) < 4:
         return False, "Der Code muss mindestens 4 Zeichen haben."
     if len(code) > 20:
         return False, "Der Code darf maximal 20 Zeichen haben."
-    if not code.replace("_", "").replace("-", "").isalnum():
-        return False, "Nur Buchstaben, Zahlen, - und _ erlaubt."
-    return True, "OK"
+    return False, "Nur Buchstaben, Zahlen, - und _ erlaubt."
+
+
+@st.fragment
+def render_login_form():
+    """Mini-Login in der Sidebar: Code eingeben oder generieren."""
+    st.markdown(
+        "Gib deinen persönlichen Code ein, um deine Sessions zu verknüpfen. "
+        "Du kannst einen eigenen Code wählen oder einen generieren lassen."
+    )
+
+    # Code-Eingabe
+    user_code_input = st.text_input(
+        "Dein Code:",
+        value=st.session_state.user_code,
+        max_chars=20,
+        placeholder="z.B. ANNA2024 oder XYZ123",
+        key="user_code_input",
+    )
+
+    col_login1, col_login2 = st.columns(2)
+
+    with col_login1:
+        if st.button("✅ Bestätigen", use_container_width=True):
+            is_valid, message = validate_user_code(user_code_input)
+            if is_valid:
+                st.session_state.user_code = user_code_input.upper()
+                st.session_state.user_code_confirmed = True
+                log_event("auth", "User eingeloggt", {"user_code": user_code_input.upper()})
+                st.rerun()
+            else:
+                st.error(message)
+
+    with col_login2:
+        if st.button("🎲 Generieren", use_container_width=True):
+            new_code = generate_user_code()
+            st.session_state.user_code = new_code
+            st.session_state.user_code_confirmed = True
+            log_event("auth", "User generiert", {"user_code": new_code})
+            st.rerun()
+
+    st.caption("💡 Merke dir deinen Code, um später weiterzumachen!")
+
+
+# Disce-KPIs im Metriken-Tab: (Label, Key in disce_metrics)
+DISCE_METRICS: tuple[tuple[str, str], ...] = (
+    ("Register", "level_match"),
+    ("Prosodie", "prosody_intelligibility"),
+    ("Kohäsion", "sentence_cohesion"),
+    ("Task-Fit", "task_exam_fit"),
+    ("Fortschritt", "goal_progress"),
+)
+
+# MASQ-Faktoren: Key → (Kurzlabel, englischer Name für den Tooltip)
+MASQ_FACTOR_LABELS = {
+    "PE": ("Planung", "Planning & Evaluation"),
+    "PS": ("Problemlösung", "Problem-Solving"),
+    "PK": ("Selbstbild", "Person Knowledge"),
+    "DA": ("Fokus", "Directed Attention"),
+    "MT": ("Übersetzung", "Mental Translation"),
+}
+
+
+# Leitfragen zur Reflexion (Phase 3); das Lernziel wird ggf. angehängt
+REFLECTION_PROMPTS_MD = """
+**Was ist mir gut gelungen?**
+- Wortwahl, Struktur, Flüssigkeit
+
+**Was war schwierig?**
+- Ein bestimmtes Wort, die Satzstellung, das Tempo
+
+**Strategien (Problem-Solving):**
+- Hast du Wörter umschrieben, wenn dir etwas nicht eingefallen ist?
+- Hast du dich selbst korrigiert?
+
+**Mentale Übersetzung:**
+- Hast du während des Sprechens im Kopf übersetzt?
+- Konntest du direkt auf Deutsch denken?
+
+**Fokus & Konzentration:**
+- Konntest du dich auf die Aufgabe konzentrieren?
+- Warst du abgelenkt?
+
+**Was will ich beim nächsten Mal anders machen?**
+"""
+
+
+# Typische Füllwörter (nur ganze Wörter, z.B. nicht "halt" in "Haltung")
+FILLER_WORDS = frozenset({"ähm", "also", "quasi", "sozusagen", "halt", "eigentlich"})
+_TOKEN_PUNCTUATION = ",.!?;:\"'()[]–-"
+
+
+@st.cache_data(show_spinner=False)
+def task_detail_markdown(task_id: str) -> tuple[str, str]:
+    """Markdown für die Aufgabendetails (Kopf + Beispielphrasen) – einmal pro Task."""
+    task = get_task(task_id)
+    details_md = "\n\n".join([
+        f"**Szenario:** {task['situation']}",
+        f"**Zielregister:** {task['register']}",
+        f"**Zeitrahmen:** {task['time_seconds']} Sekunden",
+        "---",
+        "**Deine Aufgabe:**",
+    ])
+    phrases = task.get("example_phrases") or []
+    phrases_md = (
+        "**Beispielphrasen:**\n\n" + "\n".join(f"- _{phrase}_" for phrase in phrases)
+        if phrases else ""
+    )
+    return details_md, phrases_md
+
+
+def disce_percent(value) -> int | None:
+    """Disce-Kennzahl (0–1) als ganze Prozentzahl; fehlende Werte (None) bleiben leer."""
+    if value is None:
+        return None
+    return round(float(value) * 100)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_speech_stats(transcript_text: str, duration: float) -> dict:
+    """Wortzahl, Sprechtempo (WPM) und Füllwörter – gecacht pro Transkript/Dauer."""
+    # Ein split, ein Durchlauf: Wörter zählen und Füllwörter per Set-Lookup
+    tokens = transcript_text.casefold().split() if transcript_text else []
+    word_count = len(tokens)
+    return {
+        "word_count": word_count,
+        "wpm": (word_count / duration * 60) if duration > 0 else 0,
+        "filler_count": sum(1 for t in tokens if t.strip(_TOKEN_PUNCTUATION) in FILLER_WORDS),
+    }
+
+
+def build_kleiner_baer_context(task: dict, mode: str) -> dict:
+    """Kontext für die Kleiner-Bär-Analyse (Task-Ziele + Planung + MASQ aus dem Pretest)."""
+    ss = st.session_state
+    return {
+        "source": "grosser_baer",
+        "mode": mode,
+        "task_id": ss.selected_task_id,
+        "target_level": task.get("level"),
+        "target_register": task.get("register"),
+        "time_limit_seconds": task.get("time_seconds"),
+        "learner_goal": ss.learner_goal,
+        "learner_context": ss.learner_context,
+        "user_code": ss.user_code,
+        "masq_scores": ss.get("pretest_responses", {}).get("masq_scores", {}),
+    }
+
+
+def _load_kleiner_baer_models():
+    # Lazy Import: disce_core lädt spaCy & Co. – erst nötig, wenn wirklich analysiert wird
+    from features_viewer import get_spacy_nlp, get_tagger, get_tokenizer
+    get_tokenizer()
+    get_tagger()
+    get_spacy_nlp()
+
+
+@st.cache_resource(show_spinner=False)
+def warm_up_kleiner_baer() -> Future:
+    """
+    Lädt SoMaJo, HanTa und spaCy einmal pro Prozess im Hintergrund –
+    gestartet zusammen mit Whisper, damit beides parallel läuft.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kleiner-baer")
+    future = executor.submit(_load_kleiner_baer_models)
+    executor.shutdown(wait=False)
+    return future
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def run_kleiner_baer(transcript_text: str, context: dict) -> dict:
+    """Kleiner-Bär-Analyse, gecacht pro Transkript + Kontext (z.B. bei "Nochmal versuchen")."""
+    # Läuft das Vorladen noch, darauf warten statt die Modelle ein zweites Mal zu laden
+    try:
+        warm_up_kleiner_baer().result()
+    except Exception:
+        # Vorladen fehlgeschlagen: gecachtes Future verwerfen, damit der nächste
+        # Anlauf neu lädt; die Analyse unten lädt selbst und meldet den echten Fehler
+        warm_up_kleiner_baer.clear()
+    from disce_core import analyze_text_for_llm
+    return analyze_text_for_llm(transcript_text, context=context)
+
+
+def get_feedback_markdown(feedback) -> str:
+    """Markdown zum Feedback – nur einmal pro Feedback-Objekt formatiert."""
+    cached = st.session_state.feedback_markdown
+    if cached is None or cached[0] is not feedback:
+        cached = (feedback, format_feedback_markdown(feedback))
+        st.session_state.feedback_markdown = cached
+    return cached[1]
 
 
 def reset_session():
     """Setzt die Session zurück für neue Aufnahme (behält Nutzercode + Pretest)."""
-    st.session_state.phase = "select"
-    st.session_state.selected_task_id = None
-    st.session_state.audio_bytes = None
-    st.session_state.transcript = None
-    st.session_state.feedback_result = None
-    st.session_state.recording_start = None
-    st.session_state.kleiner_baer_result = None
-    st.session_state.coach_input = None
+    st.session_state.update(SESSION_RESET_STATE)
     st.session_state.session_id = str(uuid.uuid4())
-    st.session_state.learner_goal = ""
-    st.session_state.learner_context = ""
-    st.session_state.reflection_text = ""
-    st.session_state.reflection_saved = False
-    st.session_state.session_saved = False
     # Session-Zähler erhöhen
     st.session_state.session_count += 1
     # user_code und pretest_responses bleiben erhalten!
@@ -309,14 +501,16 @@ def reset_session():
 
 def logout_user():
     """Loggt den Nutzer aus (löscht auch Nutzercode und Pretest)."""
-    st.session_state.user_code = ""
-    st.session_state.user_code_confirmed = False
-    # Pretest zurücksetzen
-    st.session_state.pretest_responses = {}
-    st.session_state.pretest_completed = False
-    st.session_state.pretest_completed_at = None
-    st.session_state.pretest_current_module = 0
-    st.session_state.session_count = 0
+    st.session_state.update({
+        "user_code": "",
+        "user_code_confirmed": False,
+        # Pretest zurücksetzen
+        "pretest_responses": {},
+        "pretest_completed": False,
+        "pretest_completed_at": None,
+        "pretest_current_module": 0,
+        "session_count": 0,
+    })
     reset_session()
     
     # Event loggen
@@ -334,8 +528,10 @@ def build_coach_input(
     reflection: str = "",
 ) -> dict:
     """Baut den JSON-Block, der später an die LLM-Coach-API geht."""
-    now = datetime.now()
+    # Zeitstempel einmal formatieren (mehrfach im Block verwendet)
+    now_iso = datetime.now().isoformat()
     recording_start = st.session_state.get("recording_start")
+    started_iso = recording_start.isoformat() if recording_start else None
 
     # Pretest-Daten für Coach-Input holen
     pretest_data = get_pretest_data_for_coach_input()
@@ -360,17 +556,18 @@ def build_coach_input(
             "session_id": st.session_state.get("session_id"),
             "session_number": st.session_state.get("session_count", 0),
             "mode": mode,
-            "started_at": recording_start.isoformat() if recording_start else None,
-            "ended_at": now.isoformat(),
+            "started_at": started_iso,
+            "ended_at": now_iso,
             "duration_seconds": duration,
         },
         # Planung der Lernenden (vor der Übung)
         "learner_planning": {
             "goal": learner_goal,
             "context": learner_context,
-            "submitted_at": recording_start.isoformat() if recording_start else None,
+            "submitted_at": started_iso,
         },
         "transcript": transcript_text,
+        # Referenzen auf kleiner_baer_result (keine Kopien) – die Hotspots liegen nur einmal im Speicher
         "analysis": {
             "layer1_deterministic": kleiner_baer_result.get("metrics_summary", {}),
             "layer2_azure": None,
@@ -381,126 +578,284 @@ def build_coach_input(
         # Reflexion der Lernenden (nach der Übung)
         "reflection": {
             "text": reflection,
-            "submitted_at": now.isoformat() if reflection else None,
+            "submitted_at": now_iso if reflection else None,
         },
     }
 
 
+def prepare_feedback_inputs(
+    transcript_text: str, task: dict, duration: float, mode: str
+) -> tuple[dict, dict, dict]:
+    """
+    Kleiner-Bär-Analyse + Coach-Input – gemeinsam für Mock- und echten Modus.
+    Schreibt Transkript, Analyse und Coach-Input in den Session State.
+
+    Returns:
+        (kb_context, kb_result, coach_input)
+    """
+    ss = st.session_state
+    kb_context = build_kleiner_baer_context(task, mode=mode)
+    kb_result = run_kleiner_baer(transcript_text, context=kb_context)
+    coach_input = build_coach_input(
+        transcript_text=transcript_text,
+        task=task,
+        duration=duration,
+        mode=mode,
+        kleiner_baer_result=kb_result,
+        learner_goal=ss.learner_goal,
+        learner_context=ss.learner_context,
+        reflection="",
+    )
+    ss.transcript_text = transcript_text
+    ss.kleiner_baer_result = kb_result
+    ss.coach_input = coach_input
+    return kb_context, kb_result, coach_input
+
+
+def generate_mock_feedback(transcript_text: str, task: dict, kb_result: dict):
+    """Feedback aus dem alten System (Mock-Modus und Fallback ohne GPT)."""
+    return generate_feedback(
+        transcript=transcript_text,
+        task=task,
+        prosody=None,
+        use_mock=True,
+        analysis=kb_result,
+    )
+
+
 def update_coach_input_with_reflection(reflection_text: str):
-    """Aktualisiert den coach_input mit der Reflexion."""
-    if st.session_state.coach_input:
-        st.session_state.coach_input["reflection"] = {
+    """Aktualisiert den coach_input mit der Reflexion (nur wenn sich der Text geändert hat)."""
+    coach_input = st.session_state.coach_input
+    if coach_input:
+        if coach_input.get("reflection", {}).get("text") == reflection_text:
+            return  # unverändert: Zeitstempel und JSON-Cache behalten
+        coach_input["reflection"] = {
             "text": reflection_text,
             "submitted_at": datetime.now().isoformat(),
         }
+        # In-place geändert → gecachten JSON-Text verwerfen
+        st.session_state.coach_input_json = None
+
+
+def get_coach_input_json(coach_input: dict) -> str:
+    """Coach-Input als eingerückter JSON-Text – nur neu serialisiert, wenn er sich ändert."""
+    cached = st.session_state.coach_input_json
+    if cached is None or cached[0] is not coach_input:
+        text = json_bytes(coach_input, indent=True).decode("utf-8")
+        cached = (coach_input, text)
+        st.session_state.coach_input_json = cached
+    return cached[1]
 
 
-def send_session_to_airtable() -> tuple[bool, str]:
+@st.fragment
+def render_reflection_section():
+    """Leitfragen, Reflexions-Textfeld und Speichern-Button (Phase 3)."""
+    # Leitfragen als Inspiration – angepasst ans Lernziel + MASQ-basiert
+    with st.expander("💡 Leitfragen zur Reflexion", expanded=False):
+        reflection_prompts = REFLECTION_PROMPTS_MD
+        # Falls Lernziel vorhanden, zusätzliche Frage
+        if st.session_state.learner_goal:
+            reflection_prompts += (
+                f"\n**Bezogen auf dein Ziel** "
+                f"({st.session_state.learner_goal}): Wie gut hast du es erreicht?"
+            )
+
+        st.markdown(reflection_prompts)
+
+    # Reflexions-Textfeld
+    reflection_input = st.text_area(
+        "Deine Gedanken:",
+        value=st.session_state.reflection_text,
+        height=120,
+        placeholder="Was nimmst du aus dieser Übung mit? Was machst du nächstes Mal anders?",
+        key="reflection_input",
+    )
+
+    # Speichern-Button für Reflexion
+    col_ref1, col_ref2 = st.columns([3, 1])
+    with col_ref2:
+        if st.button("✅ Reflexion speichern", type="primary", use_container_width=True):
+            st.session_state.reflection_text = reflection_input
+            update_coach_input_with_reflection(reflection_input)
+            st.session_state.reflection_saved = True
+            log_event("session", "Reflexion gespeichert", {"length": len(reflection_input)})
+            st.rerun(scope="fragment")
+
+    # Bestätigung anzeigen
+    if st.session_state.reflection_saved and st.session_state.reflection_text:
+        st.success("✅ Reflexion gespeichert!")
+        st.markdown(f"**Deine Reflexion:** _{st.session_state.reflection_text}_")
+
+
+def build_airtable_payload() -> dict:
+    """Flacher Payload für den Make-Webhook (alle Felder auf oberster Ebene)."""
+    coach_input = st.session_state.get("coach_input", {})
+    kleiner_baer_result = st.session_state.get("kleiner_baer_result", {})
+
+    # CEFR-Daten aus Analyse
+    cefr_data = kleiner_baer_result.get("cefr", {})
+
+    # Session-Metadaten
+    session_meta = coach_input.get("session_metadata", {})
+    task_meta = coach_input.get("task_metadata", {})
+    learner_planning = coach_input.get("learner_planning", {})
+    reflection = coach_input.get("reflection", {})
+
+    return {
+        # --- Identifikation ---
+        "session_id": st.session_state.get("session_id", ""),
+        "user_code": st.session_state.get("user_code", "ANON"),
+        "session_number": st.session_state.get("session_count", 0),
+        "created_at": datetime.now().isoformat(),
+        
+        # --- Session-Daten ---
+        "mode": session_meta.get("mode", "unknown"),
+        "task_id": task_meta.get("task_id", ""),
+        "task_situation": task_meta.get("situation", ""),
+        "target_register": task_meta.get("target_register", ""),
+        "target_level": task_meta.get("target_level", ""),
+        "time_limit_seconds": task_meta.get("time_limit_seconds", 0),
+        "duration_seconds": session_meta.get("duration_seconds", 0),
+        "learner_goal": learner_planning.get("goal", ""),
+        "learner_context": learner_planning.get("context", ""),
+        "transcript": coach_input.get("transcript", ""),
+        "reflection": reflection.get("text", ""),
+        "cefr_label": cefr_data.get("label", ""),
+        "cefr_score": cefr_data.get("score", 0.0),
+        "metrics_json": json_bytes(kleiner_baer_result.get("disce_metrics", {})).decode("utf-8"),
+        
+        # --- Pretest-Daten (NEU) ---
+        # get_pretest_data_for_airtable liefert alle Felder bereits flach und mit Defaults
+        **get_pretest_data_for_airtable(),
+    }
+
+
+def payload_digest(payload: dict) -> str:
+    """Fingerprint des Payloads ohne created_at (erkennt unveränderte Wiederholungen)."""
+    content = {key: value for key, value in payload.items() if key != "created_at"}
+    return hashlib.blake2b(json_bytes(content), digest_size=16).hexdigest()
+
+
+def post_session_payload(payload: dict, http: requests.Session) -> dict:
     """
-    Sendet die Session-Daten an Make Webhook → Airtable.
-    Make verteilt die Daten auf pretest_responses und Sessions.
+    POST an den Make-Webhook. Läuft im Worker-Thread, greift daher nicht
+    auf st.session_state zu – das Loggen übernimmt record_airtable_result().
     """
-    # NEU: Prüfe ob Airtable aktiviert ist
-    if not is_airtable_enabled():
-        log_event("airtable", "Airtable deaktiviert – Senden übersprungen")
-        return True, "Session lokal gespeichert (Airtable deaktiviert)"
-    
     try:
-        coach_input = st.session_state.get("coach_input", {})
-        kleiner_baer_result = st.session_state.get("kleiner_baer_result", {})
-        task = get_task(st.session_state.selected_task_id) if st.session_state.selected_task_id else {}
-        
-        # CEFR-Daten aus Analyse
-        cefr_data = kleiner_baer_result.get("cefr", {})
-        
-        # Session-Metadaten
-        session_meta = coach_input.get("session_metadata", {})
-        task_meta = coach_input.get("task_metadata", {})
-        learner_planning = coach_input.get("learner_planning", {})
-        reflection = coach_input.get("reflection", {})
-        
-        # Pretest-Daten holen
-        pretest_data = get_pretest_data_for_airtable()
-        
-        # =====================================================================
-        # FLACHER PAYLOAD (alle Felder auf oberster Ebene)
-        # =====================================================================
-        payload = {
-            # --- Identifikation ---
-            "session_id": st.session_state.get("session_id", ""),
-            "user_code": st.session_state.get("user_code", "ANON"),
-            "session_number": st.session_state.get("session_count", 0),
-            "created_at": datetime.now().isoformat(),
-            
-            # --- Session-Daten ---
-            "mode": session_meta.get("mode", "unknown"),
-            "task_id": task_meta.get("task_id", ""),
-            "task_situation": task_meta.get("situation", ""),
-            "target_register": task_meta.get("target_register", ""),
-            "target_level": task_meta.get("target_level", ""),
-            "time_limit_seconds": task_meta.get("time_limit_seconds", 0),
-            "duration_seconds": session_meta.get("duration_seconds", 0),
-            "learner_goal": learner_planning.get("goal", ""),
-            "learner_context": learner_planning.get("context", ""),
-            "transcript": coach_input.get("transcript", ""),
-            "reflection": reflection.get("text", ""),
-            "cefr_label": cefr_data.get("label", ""),
-            "cefr_score": cefr_data.get("score", 0.0),
-            "metrics_json": json.dumps(kleiner_baer_result.get("disce_metrics", {})),
-            
-            # --- Pretest-Daten (NEU) ---
-            "pretest_completed": pretest_data.get("pretest_completed", False),
-            "pretest_completed_at": pretest_data.get("pretest_completed_at", ""),
-            "cefr_self_overall": pretest_data.get("cefr_self_overall", ""),
-            "cefr_self_speaking": pretest_data.get("cefr_self_speaking", ""),
-            "has_official_cert": pretest_data.get("has_official_cert", False),
-            "official_cert_type": pretest_data.get("official_cert_type", ""),
-            "learning_duration_months": pretest_data.get("learning_duration_months", 0),
-            "learning_context": pretest_data.get("learning_context", ""),
-            "native_language": pretest_data.get("native_language", ""),
-            "other_languages": pretest_data.get("other_languages", ""),
-            "masq_total": pretest_data.get("masq_total", 0),
-            "masq_level": pretest_data.get("masq_level", ""),
-            "masq_pe_mean": pretest_data.get("masq_pe_mean", 0),
-            "masq_ps_mean": pretest_data.get("masq_ps_mean", 0),
-            "masq_pk_mean": pretest_data.get("masq_pk_mean", 0),
-            "masq_mt_mean": pretest_data.get("masq_mt_mean", 0),
-            "masq_da_mean": pretest_data.get("masq_da_mean", 0),
-        }
-        
-        # An Make Webhook senden
-        response = requests.post(
+        response = http.post(
             MAKE_WEBHOOK_URL,
-            json=payload,
+            data=json_bytes(payload),
             headers={"Content-Type": "application/json"},
             timeout=10,
         )
-        
-        # NEU: Payload loggen
-        response_data = None
-        try:
-            response_data = response.json()
-        except:
-            response_data = {"status_code": response.status_code, "text": response.text[:200]}
-        
-        log_payload("make_webhook", payload, response_data)
-        
-        if response.status_code == 200:
-            return True, "Session erfolgreich gespeichert!"
-        else:
-            log_error("airtable", f"HTTP {response.status_code}", {"response": response.text[:500]})
-            return False, f"Fehler beim Speichern: HTTP {response.status_code}"
-            
     except requests.exceptions.Timeout:
-        log_error("airtable", "Timeout", {"url": MAKE_WEBHOOK_URL})
-        return False, "Timeout: Server antwortet nicht."
+        return {"success": False, "message": "Timeout: Server antwortet nicht.",
+                "error": ("Timeout", {"url": MAKE_WEBHOOK_URL})}
     except requests.exceptions.RequestException as e:
-        log_error("airtable", "RequestException", {"error": str(e)})
-        return False, f"Verbindungsfehler: {str(e)}"
+        return {"success": False, "message": f"Verbindungsfehler: {str(e)}",
+                "error": ("RequestException", {"error": str(e)})}
+    except Exception as e:
+        return {"success": False, "message": f"Fehler: {str(e)}",
+                "error": ("Exception", {"error": str(e)})}
+
+    try:
+        response_data = response.json()
+    except ValueError:
+        response_data = {"status_code": response.status_code, "text": response.text[:200]}
+
+    if response.status_code == 200:
+        return {"success": True, "message": "Session erfolgreich gespeichert!", "response": response_data}
+    return {
+        "success": False,
+        "message": f"Fehler beim Speichern: HTTP {response.status_code}",
+        "response": response_data,
+        "error": (f"HTTP {response.status_code}", {"response": response.text[:500]}),
+    }
+
+
+def record_airtable_result(payload: dict, result: dict) -> tuple[bool, str]:
+    """Loggt Payload/Fehler eines Webhook-Calls (im Script-Thread) und gibt (success, message) zurück."""
+    if "response" in result:
+        log_payload("make_webhook", payload, result["response"])
+    if "error" in result:
+        message, details = result["error"]
+        log_error("airtable", message, details)
+    return result["success"], result["message"]
+
+
+@st.cache_resource
+def get_webhook_session() -> requests.Session:
+    """
+    HTTP-Session für den Make-Webhook (Keep-Alive, einmal pro Prozess).
+
+    Wiederholt nur fehlgeschlagene Verbindungsaufbauten – ein POST, der
+    den Server erreicht hat, wird nie doppelt geschickt (sonst doppelte Zeilen).
+    """
+    session = requests.Session()
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.5)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+    return session
+
+
+@st.cache_resource
+def get_airtable_executor() -> ThreadPoolExecutor:
+    """Worker-Pool für die Webhook-Calls (einmal pro Prozess)."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="airtable")
+
+
+def send_session_to_airtable() -> tuple[bool, str] | None:
+    """
+    Sendet die Session-Daten an Make Webhook → Airtable.
+    Make verteilt die Daten auf pretest_responses und Sessions.
+
+    Der POST läuft im Hintergrund; poll_airtable_save() holt das Ergebnis ab.
+
+    Returns:
+        (success, message), wenn sofort feststeht, sonst None (Upload läuft)
+    """
+    # NEU: Prüfe ob Airtable aktiviert ist
+    if not is_airtable_enabled():
+        log_event("airtable", "Airtable deaktiviert – Senden übersprungen")
+        return True, "Session lokal gespeichert (Airtable deaktiviert)"
+
+    try:
+        payload = build_airtable_payload()
     except Exception as e:
         log_error("airtable", "Exception", {"error": str(e)})
         return False, f"Fehler: {str(e)}"
 
+    # Identische Session nicht doppelt an Airtable schicken
+    if payload_digest(payload) == st.session_state.airtable_saved_digest:
+        log_event("airtable", "Unveränderte Session – Senden übersprungen")
+        return True, "Session bereits gespeichert"
+
+    future = get_airtable_executor().submit(post_session_payload, payload, get_webhook_session())
+    st.session_state.airtable_save = (payload, future)
+    return None
+
+
+@st.fragment(run_every=1.0)
+def poll_airtable_save():
+    """Zeigt den laufenden Upload an und prüft jede Sekunde, ob er fertig ist."""
+    pending = st.session_state.airtable_save
+    if pending is None:
+        return
+
+    payload, future = pending
+    if not future.done():
+        st.info("⏳ Speichere Session...")
+        return
+
+    st.session_state.airtable_save = None
+    success, message = record_airtable_result(payload, future.result())
+    if success:
+        st.session_state.session_saved = True
+        st.session_state.airtable_saved_digest = payload_digest(payload)
+    else:
+        st.toast(f"❌ {message}")
+    # Ganze Seite neu: Speichern-Button bzw. "Gespeichert" anzeigen
+    st.rerun()
+
 # =============================================================================
 # GPT FEEDBACK WRAPPER CLASS
 # =============================================================================
@@ -550,43 +905,8 @@ with st.sidebar:
             st.rerun()
 
     else:
-        # Nicht eingeloggt: Login-Formular
-        st.markdown(
-            "Gib deinen persönlichen Code ein, um deine Sessions zu verknüpfen. "
-            "Du kannst einen eigenen Code wählen oder einen generieren lassen."
-        )
-
-        # Code-Eingabe
-        user_code_input = st.text_input(
-            "Dein Code:",
-            value=st.session_state.user_code,
-            max_chars=20,
-            placeholder="z.B. ANNA2024 oder XYZ123",
-            key="user_code_input",
-        )
-
-        col_login1, col_login2 = st.columns(2)
-
-        with col_login1:
-            if st.button("✅ Bestätigen", use_container_width=True):
-                is_valid, message = validate_user_code(user_code_input)
-                if is_valid:
-                    st.session_state.user_code = user_code_input.upper()
-                    st.session_state.user_code_confirmed = True
-                    log_event("auth", "User eingeloggt", {"user_code": user_code_input.upper()})
-                    st.rerun()
-                else:
-                    st.error(message)
-
-        with col_login2:
-            if st.button("🎲 Generieren", use_container_width=True):
-                new_code = generate_user_code()
-                st.session_state.user_code = new_code
-                st.session_state.user_code_confirmed = True
-                log_event("auth", "User generiert", {"user_code": new_code})
-                st.rerun()
-
-        st.caption("💡 Merke dir deinen Code, um später weiterzumachen!")
+        # Nicht eingeloggt: Login-Formular (Fragment – Tippen lädt nicht die ganze Seite neu)
+        render_login_form()
 
     st.markdown("---")
 
@@ -680,11 +1000,8 @@ if st.session_state.user_code_confirmed:
 if st.session_state.phase == "select":
     st.header("1️⃣ Wähle deine Sprechaufgabe")
 
-    # Task-Auswahl: get_task_choices() gibt Liste von (label, id) Tuples
-    task_choices_list = get_task_choices()
-
-    # Baue ein Dict: {label: id}
-    task_choices = {label: tid for label, tid in task_choices_list}
+    # Task-Auswahl: {label: id}, statisch und daher nur einmal pro Prozess gebaut
+    task_choices = get_task_choice_map()
 
     selected_label = st.selectbox(
         "Welche Situation möchtest du üben?",
@@ -696,18 +1013,13 @@ if st.session_state.phase == "select":
     task = get_task(task_id)
 
     # Task-Details anzeigen
+    details_md, phrases_md = task_detail_markdown(task_id)
     with st.expander("📋 Aufgabendetails", expanded=True):
-        st.markdown(f"**Szenario:** {task['situation']}")
-        st.markdown(f"**Zielregister:** {task['register']}")
-        st.markdown(f"**Zeitrahmen:** {task['time_seconds']} Sekunden")
-        st.markdown("---")
-        st.markdown("**Deine Aufgabe:**")
+        st.markdown(details_md)
         st.info(task["task"])
 
-        if task.get("example_phrases"):
-            st.markdown("**Beispielphrasen:**")
-            for phrase in task["example_phrases"]:
-                st.markdown(f"- _{phrase}_")
+        if phrases_md:
+            st.markdown(phrases_md)
 
     # =========================================================================
     # PLANUNGSFELD: Persönliches Lernziel
@@ -776,6 +1088,8 @@ if st.session_state.phase == "select":
             st.session_state.selected_task_id = task_id
             st.session_state.phase = "record"
             st.session_state.recording_start = datetime.now()
+            st.session_state.recording_start_mono = time.monotonic()
+            st.session_state.recording_duration = None
             
             # Event loggen
             log_event("session", "Aufnahme gestartet", {"task_id": task_id})
@@ -810,9 +1124,12 @@ elif st.session_state.phase == "record":
     # Audio-Aufnahme oder Mock-Modus
     if not is_mock_mode():
         # Echter Modus: Audio-Aufnahme
-        try:
-            from audio_recorder_streamlit import audio_recorder
-
+        if not AUDIO_RECORDER_AVAILABLE:
+            st.error(
+                "❌ Audio-Recorder nicht verfügbar. "
+                "Aktiviere den Mock-Modus in der Sidebar."
+            )
+        else:
             st.markdown("### 🎙️ Klicke zum Aufnehmen:")
 
             audio_bytes = audio_recorder(
@@ -827,6 +1144,20 @@ elif st.session_state.phase == "record":
 
             if audio_bytes:
                 st.session_state.audio_bytes = audio_bytes
+
+                # Whisper schon starten, während die Aufnahme angehört wird;
+                # parallel dazu die Modelle für Kleiner Bär laden
+                warm_up_kleiner_baer()
+                if OPENAI_AVAILABLE:
+                    key = audio_digest(audio_bytes)
+                    if st.session_state.transcription_key != key:
+                        try:
+                            st.session_state.transcription_future = start_transcription(audio_bytes)
+                            st.session_state.transcription_key = key
+                        except Exception as e:
+                            # z.B. kein API-Key – Phase 3 transkribiert dann synchron
+                            log_error("whisper", str(e))
+
                 st.success("✅ Aufnahme erhalten!")
                 st.audio(audio_bytes, format="audio/wav")
 
@@ -842,12 +1173,6 @@ elif st.session_state.phase == "record":
             else:
                 st.warning("👆 Klicke auf das Mikrofon um die Aufnahme zu starten.")
 
-        except ImportError:
-            st.error(
-                "❌ Audio-Recorder nicht verfügbar. "
-                "Aktiviere den Mock-Modus in der Sidebar."
-            )
-
     else:
         # Mock-Modus: Text-Eingabe statt Audio
         st.warning("🧪 **Mock-Modus aktiv** – Gib deinen Text ein statt zu sprechen:")
@@ -883,18 +1208,25 @@ elif st.session_state.phase == "record":
 elif st.session_state.phase == "feedback":
     st.header("3️⃣ Dein Feedback")
 
-    task = get_task(st.session_state.selected_task_id)
-
-    # Berechne Aufnahmedauer
-    if st.session_state.recording_start:
-        duration = (
-            datetime.now() - st.session_state.recording_start
-        ).total_seconds()
-    else:
-        duration = 60.0
+    # Ein Alias für die ganze Phase statt wiederholter st.session_state-Lookups
+    ss = st.session_state
+    task = get_task(ss.selected_task_id)
+
+    # Aufnahmedauer einmal beim Eintritt messen (monotone Uhr, unabhängig von Uhrzeit-Sprüngen)
+    if ss.recording_duration is None:
+        if ss.recording_start_mono is not None:
+            ss.recording_duration = time.monotonic() - ss.recording_start_mono
+        elif ss.recording_start:
+            # z.B. vom Admin-Navigator gesetzt (nur datetime vorhanden)
+            ss.recording_duration = (
+                datetime.now() - ss.recording_start
+            ).total_seconds()
+        else:
+            ss.recording_duration = 60.0
+    duration = ss.recording_duration
 
     # Feedback generieren (wenn noch nicht vorhanden)
-    if st.session_state.feedback_result is None:
+    if ss.feedback_result is None:
         with st.spinner("🔍 Analysiere deine Aufnahme..."):
 
             if is_mock_mode():
@@ -902,52 +1234,17 @@ elif st.session_state.phase == "feedback":
                 # MOCK-MODUS (wie bisher)
                 # =============================================================
                 transcript_text = (
-                    st.session_state.transcript
+                    ss.transcript
                     or "Dies ist ein Mock-Transkript für Testing."
                 )
 
-                # 1) Kleiner Bär: deterministische Analyse (Schicht 1 + CEFR + KPIs)
-                kb_result = analyze_text_for_llm(
-                    transcript_text,
-                    context={
-                        "source": "grosser_baer",
-                        "mode": "mock_speaking",
-                        "task_id": st.session_state.selected_task_id,
-                        "target_level": task.get("level"),
-                        "target_register": task.get("register"),
-                        "time_limit_seconds": task.get("time_seconds"),
-                        "learner_goal": st.session_state.learner_goal,
-                        "learner_context": st.session_state.learner_context,
-                        "user_code": st.session_state.user_code,
-                        # NEU: MASQ-Scores aus Pretest
-                        "masq_scores": st.session_state.get("pretest_responses", {}).get("masq_scores", {}),
-                    },
-                )
-                st.session_state.kleiner_baer_result = kb_result
-
-                # 2) Coach-Input-Block bauen
-                coach_input = build_coach_input(
-                    transcript_text=transcript_text,
-                    task=task,
-                    duration=duration,
-                    mode="mock_speaking",
-                    kleiner_baer_result=kb_result,
-                    learner_goal=st.session_state.learner_goal,
-                    learner_context=st.session_state.learner_context,
-                    reflection="",
+                # 1) + 2) Kleiner Bär + Coach-Input
+                _, kb_result, coach_input = prepare_feedback_inputs(
+                    transcript_text, task, duration, mode="mock_speaking"
                 )
-                st.session_state.coach_input = coach_input
 
                 # 3) Mock-Feedback (altes System)
-                feedback = generate_feedback(
-                    transcript=transcript_text,
-                    task=task,
-                    prosody=None,
-                    use_mock=True,
-                )
-
-                st.session_state.feedback_result = feedback
-                st.session_state.transcript_text = transcript_text
+                feedback = generate_mock_feedback(transcript_text, task, kb_result)
                 
                 # NEU: Mock-LLM-Call loggen
                 log_llm_call("mock_feedback", coach_input, "Mock-Feedback generiert")
@@ -958,59 +1255,55 @@ elif st.session_state.phase == "feedback":
                 # =============================================================
                 
                 # 1) Audio transkribieren mit Whisper (wenn Audio vorhanden)
-                if st.session_state.audio_bytes and OPENAI_AVAILABLE:
+                if ss.audio_bytes and OPENAI_AVAILABLE:
                     with st.spinner("🎙️ Transkribiere Audio mit Whisper..."):
                         try:
-                            transcript_text = transcribe_audio(st.session_state.audio_bytes)
+                            future = ss.transcription_future
+                            if (
+                                future is not None
+                                and ss.transcription_key == audio_digest(ss.audio_bytes)
+                            ):
+                                # Im Hintergrund gestartet (Phase 2) – meist schon fertig
+                                transcript_text = future.result()
+                            else:
+                                transcript_text = transcribe_audio(ss.audio_bytes)
                             log_event("whisper", "Transkription erfolgreich", {"length": len(transcript_text)})
                         except Exception as e:
                             st.error(f"❌ Whisper-Fehler: {str(e)}")
                             log_error("whisper", str(e))
-                            transcript_text = st.session_state.transcript or "Transkription fehlgeschlagen."
+                            transcript_text = ss.transcript or "Transkription fehlgeschlagen."
                 else:
                     # Fallback: Text aus Mock-Eingabe oder Platzhalter
-                    transcript_text = st.session_state.transcript or "Kein Text vorhanden."
-                
-                st.session_state.transcript_text = transcript_text
-
-                # 2) Kleiner Bär: deterministische Analyse
-                kb_result = analyze_text_for_llm(
-                    transcript_text,
-                    context={
-                        "source": "grosser_baer",
-                        "mode": "speaking",
-                        "task_id": st.session_state.selected_task_id,
-                        "target_level": task.get("level"),
-                        "target_register": task.get("register"),
-                        "time_limit_seconds": task.get("time_seconds"),
-                        "learner_goal": st.session_state.learner_goal,
-                        "learner_context": st.session_state.learner_context,
-                        "user_code": st.session_state.user_code,
-                        # NEU: MASQ-Scores aus Pretest
-                        "masq_scores": st.session_state.get("pretest_responses", {}).get("masq_scores", {}),
-                    },
-                )
-                st.session_state.kleiner_baer_result = kb_result
-
-                # 3) Coach-Input-Block bauen
-                coach_input = build_coach_input(
-                    transcript_text=transcript_text,
-                    task=task,
-                    duration=duration,
-                    mode="speaking",
-                    kleiner_baer_result=kb_result,
-                    learner_goal=st.session_state.learner_goal,
-                    learner_context=st.session_state.learner_context,
-                    reflection="",
+                    transcript_text = ss.transcript or "Kein Text vorhanden."
+
+                # 2) + 3) Kleiner Bär + Coach-Input
+                kb_context, kb_result, coach_input = prepare_feedback_inputs(
+                    transcript_text, task, duration, mode="speaking"
                 )
-                st.session_state.coach_input = coach_input
 
                 # 4) GPT-4o-mini Coaching-Feedback
-                if OPENAI_AVAILABLE:
+                feedback_key = (
+                    feedback_cache_key(transcript_text, kb_context)
+                    if OPENAI_AVAILABLE else None
+                )
+                cached_feedback = feedback_key and get_cached_feedback(feedback_key)
+                if cached_feedback:
+                    # Gleiches Transkript + Kontext (z.B. "Nochmal versuchen"): kein neuer GPT-Call
+                    feedback = GPTFeedback(cached_feedback, kb_result.get("cefr", {}))
+                    log_event("gpt", "Coach-Feedback aus Cache", {"length": len(cached_feedback)})
+                elif OPENAI_AVAILABLE:
                     with st.spinner("🤖 Generiere Coaching-Feedback mit GPT..."):
                         try:
-                            gpt_feedback_text = generate_coach_feedback(coach_input)
+                            # Feedback live einblenden, sobald die ersten Tokens da sind;
+                            # danach übernimmt der Feedback-Tab die Anzeige
+                            stream_box = st.empty()
+                            with stream_box.container():
+                                gpt_feedback_text = st.write_stream(
+                                    stream_coach_feedback(coach_input)
+                                ).strip()
+                            stream_box.empty()
                             feedback = GPTFeedback(gpt_feedback_text, kb_result.get("cefr", {}))
+                            store_feedback(feedback_key, gpt_feedback_text)
                             
                             # NEU: LLM-Call loggen
                             log_llm_call("gpt_coach", coach_input, gpt_feedback_text)
@@ -1019,37 +1312,30 @@ elif st.session_state.phase == "feedback":
                             st.error(f"❌ GPT-Fehler: {str(e)}")
                             log_error("gpt", str(e), {"coach_input_keys": list(coach_input.keys())})
                             # Fallback auf Mock-Feedback
-                            feedback = generate_feedback(
-                                transcript=transcript_text,
-                                task=task,
-                                prosody=None,
-                                use_mock=True,
-                            )
+                            feedback = generate_mock_feedback(transcript_text, task, kb_result)
                 else:
                     # OpenAI nicht verfügbar → Mock-Feedback
                     st.warning("⚠️ OpenAI nicht verfügbar, nutze Mock-Feedback")
-                    feedback = generate_feedback(
-                        transcript=transcript_text,
-                        task=task,
-                        prosody=None,
-                        use_mock=True,
-                    )
+                    feedback = generate_mock_feedback(transcript_text, task, kb_result)
 
-                st.session_state.feedback_result = feedback
+            ss.feedback_result = feedback
 
     # Ergebnisse aus Session holen
-    feedback = st.session_state.feedback_result
-    transcript_text = st.session_state.get("transcript_text", "")
+    feedback = ss.feedback_result
+    transcript_text = ss.get("transcript_text", "")
+    # Einmal für Transkript- und Metriken-Tab
+    speech_stats = compute_speech_stats(transcript_text, duration)
 
-    kleiner_baer_result = st.session_state.get("kleiner_baer_result")
-    coach_input = st.session_state.get("coach_input")
+    kleiner_baer_result = ss.get("kleiner_baer_result")
+    coach_input = ss.get("coach_input")
     cefr_from_kb = None
     if kleiner_baer_result and "cefr" in kleiner_baer_result:
         cefr_from_kb = kleiner_baer_result["cefr"]
 
     # Lernziel zur Erinnerung anzeigen
-    if st.session_state.learner_goal:
-        st.info(f"🎯 **Dein Fokus war:** {st.session_state.learner_goal}")
+    learner_goal = ss.learner_goal
+    if learner_goal:
+        st.info(f"🎯 **Dein Fokus war:** {learner_goal}")
 
     # Tabs für verschiedene Ansichten
     tabs_list = ["💬 Feedback", "📝 Transkript", "📊 Metriken"]
@@ -1102,7 +1388,7 @@ elif st.session_state.phase == "feedback":
             st.markdown(feedback.text)
         else:
             # Altes Mock-Format
-            st.markdown(format_feedback_markdown(feedback))
+            st.markdown(get_feedback_markdown(feedback))
 
         # Hinweis zum Modus
         if hasattr(feedback, "is_mock") and feedback.is_mock:
@@ -1121,8 +1407,7 @@ elif st.session_state.phase == "feedback":
 
         col1, col2 = st.columns(2)
         with col1:
-            word_count = len(transcript_text.split()) if transcript_text else 0
-            st.metric("Wörter", word_count)
+            st.metric("Wörter", speech_stats["word_count"])
         with col2:
             st.metric("Dauer", f"{duration:.0f}s")
 
@@ -1140,19 +1425,15 @@ elif st.session_state.phase == "feedback":
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            word_count = len(transcript_text.split()) if transcript_text else 0
-            wpm = (word_count / duration * 60) if duration > 0 else 0
             st.metric(
                 "Sprechtempo",
-                f"{wpm:.0f} WPM",
+                f"{speech_stats['wpm']:.0f} WPM",
                 help="Wörter pro Minute (120-150 ist normal)",
             )
 
         with col2:
             # Mock: Zähle typische Füllwörter
-            filler_words = ["ähm", "also", "quasi", "sozusagen", "halt", "eigentlich"]
-            filler_count = sum(transcript_text.lower().count(fw) for fw in filler_words)
-            st.metric("Füllwörter", filler_count, help="ähm, also, quasi, etc.")
+            st.metric("Füllwörter", speech_stats["filler_count"], help="ähm, also, quasi, etc.")
 
         with col3:
             st.metric("Flüssigkeit", "–" if is_mock_mode() else "75%")
@@ -1171,17 +1452,20 @@ elif st.session_state.phase == "feedback":
             disce = feedback.disce_metrics
 
         if disce:
-            cols = st.columns(5)
-            metrics = [
-                ("Register", "level_match"),
-                ("Prosodie", "prosody_intelligibility"),
-                ("Kohäsion", "sentence_cohesion"),
-                ("Task-Fit", "task_exam_fit"),
-                ("Fortschritt", "goal_progress"),
-            ]
-            for col, (label, key) in zip(cols, metrics):
-                val = float(disce.get(key, 0))
-                col.metric(label, f"{val:.0%}")
+            # Eine Tabelle statt fünf einzelner Metric-Widgets
+            st.dataframe(
+                [
+                    {"Dimension": label, "Wert": disce_percent(disce.get(key, 0))}
+                    for label, key in DISCE_METRICS
+                ],
+                column_config={
+                    "Wert": st.column_config.ProgressColumn(
+                        "Wert", format="%d%%", min_value=0, max_value=100,
+                    ),
+                },
+                hide_index=True,
+                use_container_width=True,
+            )
         else:
             st.info("Noch keine Disce-Metriken verfügbar.")
 
@@ -1189,18 +1473,11 @@ elif st.session_state.phase == "feedback":
         st.markdown("---")
         st.subheader("Metakognitives Profil (MASQ)")
         
-        masq_scores = st.session_state.get("pretest_responses", {}).get("masq_scores", {})
+        masq_scores = ss.get("pretest_responses", {}).get("masq_scores", {})
         if masq_scores and masq_scores.get("factors"):
             factors = masq_scores.get("factors", {})
-            cols = st.columns(5)
-            factor_labels = {
-                "PE": ("Planung", "Planning & Evaluation"),
-                "PS": ("Problemlösung", "Problem-Solving"),
-                "PK": ("Selbstbild", "Person Knowledge"),
-                "DA": ("Fokus", "Directed Attention"),
-                "MT": ("Übersetzung", "Mental Translation"),
-            }
-            for col, (key, (short, full)) in zip(cols, factor_labels.items()):
+            cols = st.columns(len(MASQ_FACTOR_LABELS))
+            for col, (key, (short, full)) in zip(cols, MASQ_FACTOR_LABELS.items()):
                 if key in factors:
                     mean = factors[key].get("mean", 0)
                     # MT ist negativ (niedrig = gut)
@@ -1232,7 +1509,9 @@ elif st.session_state.phase == "feedback":
             )
 
             if coach_input:
-                st.json(coach_input)
+                # Erst auf Wunsch serialisieren und rendern (Tab-Inhalte laufen bei jedem Rerun mit)
+                if st.toggle("🔎 Coach-Input anzeigen", key="show_coach_input"):
+                    st.code(get_coach_input_json(coach_input), language="json")
             else:
                 st.info(
                     "Noch kein Coach-Input verfügbar. "
@@ -1250,61 +1529,8 @@ elif st.session_state.phase == "feedback":
         "Das hilft dir, das Gelernte zu verankern."
     )
 
-    # Leitfragen als Inspiration – angepasst ans Lernziel + MASQ-basiert
-    with st.expander("💡 Leitfragen zur Reflexion", expanded=False):
-        reflection_prompts = """
-**Was ist mir gut gelungen?**
-- Wortwahl, Struktur, Flüssigkeit
-
-**Was war schwierig?**
-- Ein bestimmtes Wort, die Satzstellung, das Tempo
-
-**Strategien (Problem-Solving):**
-- Hast du Wörter umschrieben, wenn dir etwas nicht eingefallen ist?
-- Hast du dich selbst korrigiert?
-
-**Mentale Übersetzung:**
-- Hast du während des Sprechens im Kopf übersetzt?
-- Konntest du direkt auf Deutsch denken?
-
-**Fokus & Konzentration:**
-- Konntest du dich auf die Aufgabe konzentrieren?
-- Warst du abgelenkt?
-
-**Was will ich beim nächsten Mal anders machen?**
-"""
-        # Falls Lernziel vorhanden, zusätzliche Frage
-        if st.session_state.learner_goal:
-            reflection_prompts += (
-                f"\n**Bezogen auf dein Ziel** "
-                f"({st.session_state.learner_goal}): Wie gut hast du es erreicht?"
-            )
-
-        st.markdown(reflection_prompts)
-
-    # Reflexions-Textfeld
-    reflection_input = st.text_area(
-        "Deine Gedanken:",
-        value=st.session_state.reflection_text,
-        height=120,
-        placeholder="Was nimmst du aus dieser Übung mit? Was machst du nächstes Mal anders?",
-        key="reflection_input",
-    )
-
-    # Speichern-Button für Reflexion
-    col_ref1, col_ref2 = st.columns([3, 1])
-    with col_ref2:
-        if st.button("✅ Reflexion speichern", type="primary", use_container_width=True):
-            st.session_state.reflection_text = reflection_input
-            update_coach_input_with_reflection(reflection_input)
-            st.session_state.reflection_saved = True
-            log_event("session", "Reflexion gespeichert", {"length": len(reflection_input)})
-            st.rerun()
-
-    # Bestätigung anzeigen
-    if st.session_state.reflection_saved and st.session_state.reflection_text:
-        st.success("✅ Reflexion gespeichert!")
-        st.markdown(f"**Deine Reflexion:** _{st.session_state.reflection_text}_")
+    # Eigenes Fragment: Eingaben hier laden nicht die ganze Feedback-Seite neu
+    render_reflection_section()
 
     # =========================================================================
     # AKTIONEN
@@ -1315,15 +1541,22 @@ elif st.session_state.phase == "feedback":
 
     with col1:
         if st.button("🔄 Nochmal versuchen"):
-            st.session_state.phase = "record"
-            st.session_state.audio_bytes = None
-            st.session_state.transcript = None
-            st.session_state.feedback_result = None
-            st.session_state.kleiner_baer_result = None
-            st.session_state.coach_input = None
-            st.session_state.reflection_text = ""
-            st.session_state.reflection_saved = False
-            st.session_state.session_saved = False
+            ss.phase = "record"
+            ss.audio_bytes = None
+            ss.transcription_future = None
+            ss.transcription_key = None
+            ss.transcript = None
+            ss.recording_start = None
+            ss.recording_start_mono = None
+            ss.recording_duration = None
+            ss.feedback_result = None
+            ss.feedback_markdown = None
+            ss.kleiner_baer_result = None
+            ss.coach_input = None
+            ss.coach_input_json = None
+            ss.reflection_text = ""
+            ss.reflection_saved = False
+            ss.session_saved = False
             st.rerun()
 
     with col2:
@@ -1333,21 +1566,26 @@ elif st.session_state.phase == "feedback":
 
     with col3:
         # Session speichern Button mit Webhook-Anbindung
-        if st.session_state.session_saved:
+        if ss.session_saved:
             st.success("✅ Gespeichert!")
+        elif ss.airtable_save is not None:
+            # Upload läuft – das Fragment fragt nach, bis er fertig ist
+            poll_airtable_save()
         else:
             if st.button("💾 Session speichern", type="primary"):
-                # Reflexion aktualisieren falls vorhanden
+                # Reflexion aktualisieren falls vorhanden (Textfeld liegt im Fragment)
+                reflection_input = ss.get("reflection_input", "")
                 if reflection_input:
-                    st.session_state.reflection_text = reflection_input
+                    ss.reflection_text = reflection_input
                     update_coach_input_with_reflection(reflection_input)
                 
-                # An Airtable senden
-                with st.spinner("Speichere Session..."):
-                    success, message = send_session_to_airtable()
-                
+                # An Airtable senden (läuft im Hintergrund weiter)
+                result = send_session_to_airtable()
+                if result is None:
+                    st.rerun()
+                success, message = result
                 if success:
-                    st.session_state.session_saved = True
+                    ss.session_saved = True
                     st.rerun()
                 else:
                     st.error(f"❌ {message}")
@@ -5,33 +5,33 @@ from somajo import SoMaJo
 from HanTa import HanoverTagger as ht
 
 
-def read_text_from_file(path_str: str) -> str:
+def tokenize_file(path_str: str):
+    """
+    Verwendet SoMaJo, um eine Textdatei in Sätze und Tokens zu zerlegen.
+    Die Datei wird absatzweise gelesen und die Sätze werden einzeln
+    geliefert (Generator), statt alles auf einmal im Speicher zu halten.
+
+    Hinweis: Leerzeilen trennen Absätze, ein Satz endet daher spätestens
+    an einer Leerzeile (auch ohne Satzzeichen).
+    """
     path = Path(path_str)
     if not path.exists():
         raise FileNotFoundError(f"Datei nicht gefunden: {path}")
-    return path.read_text(encoding="utf-8")
-
-
-def tokenize_and_split(text: str):
-    """Verwendet SoMaJo, um Text in Sätze und Tokens zu zerlegen."""
     tokenizer = SoMaJo(language="de_CMC", split_sentences=True)
-    docs = [text]
-    return list(tokenizer.tokenize_text(docs))
+    with path.open(encoding="utf-8") as f:
+        yield from tokenizer.tokenize_text_file(f, paragraph_separator="empty_lines")
 
 
 def pos_tag_sentences(sentences):
     """
-    Nimmt eine Liste von Sätzen (SoMaJo-Token-Objekte) und gibt
-    für jeden Satz eine Liste von Tuples zurück (Wort, Lemma, POS, ...).
+    Nimmt Sätze (SoMaJo-Token-Objekte) und liefert für jeden Satz
+    eine Liste von Tuples (Wort, Lemma, POS, ...), Satz für Satz.
     """
     tagger = ht.HanoverTagger("morphmodel_ger.pgz")
 
-    tagged_sentences = []
     for sent in sentences:
         words = [tok.text for tok in sent]
-        tagged = tagger.tag_sent(words)
-        tagged_sentences.append(tagged)
-    return tagged_sentences
+        yield tagger.tag_sent(words)
 
 
 # --- Komplexitäts-Metriken -------------------------------------------------
@@ -124,13 +124,16 @@ if __name__ == "__main__":
         sys.exit(1)
 
     filename = sys.argv[1]
-    text = read_text_from_file(filename)
 
-    # 1) Tokenisierung + Satzsegmentierung mit SoMaJo
-    sentences = tokenize_and_split(text)
+    # 1) + 2) Tokenisierung (SoMaJo) und POS-Tagging (HanTa) laufen
+    # satzweise, jeder Satz wird direkt ausgegeben und ausgewertet
+    tagged_sentences = pos_tag_sentences(tokenize_file(filename))
 
-    # 2) POS-Tagging mit HanTa
-    tagged_sentences = pos_tag_sentences(sentences)
+    lengths = []
+    finite_verbs = []
+    subclauses = []
+    complex_nps = []
+    first_tuple = None
 
     # Optional: detailierte Ausgabe (Wort -> Lemma, POS)
     print("=== Detailansicht (Wort, Lemma, POS) ===")
@@ -145,20 +148,23 @@ if __name__ == "__main__":
                 print(f"  {token_tuple}")
         print()
 
+        if i == 1 and sent:
+            first_tuple = sent[0]
+
+        # 3) Komplexitäts-Metriken pro Satz sammeln
+        lengths += sentence_lengths([sent])
+        finite_verbs += finite_verbs_per_sentence([sent])
+        subclauses += estimated_subclauses([sent])
+        complex_nps += complex_nps_per_sentence([sent])
+
     # Debug: Beispiel-Tuple aus dem ersten Satz
     print("DEBUG: Beispiel-Tuple aus dem ersten Satz:")
-    if tagged_sentences and tagged_sentences[0]:
-        print("  ", tagged_sentences[0][0], " (len =", len(tagged_sentences[0][0]), ")")
+    if first_tuple is not None:
+        print("  ", first_tuple, " (len =", len(first_tuple), ")")
     print()
 
-    # 3) Komplexitäts-Metriken berechnen
-    lengths = sentence_lengths(tagged_sentences)
-    finite_verbs = finite_verbs_per_sentence(tagged_sentences)
-    subclauses = estimated_subclauses(tagged_sentences)
-    complex_nps = complex_nps_per_sentence(tagged_sentences)
-
     print("=== Syntaktische Komplexitätsmetriken (Heuristiken) ===")
-    print(f"Anzahl Sätze:                       {len(tagged_sentences)}")
+    print(f"Anzahl Sätze:                       {len(lengths)}")
     if lengths:
         print(f"Durchschnittliche Satzlänge:       {mean(lengths):.2f} Tokens")
         print(f"Min/Max Satzlänge:                 {min(lengths)} / {max(lengths)} Tokens")